@@ -60,6 +60,9 @@ def simulate_load_config():
 config = simulate_load_config()
 for command, aliases in config.items():
     for alias in aliases:
+        if app.has_alias(alias):
+            print(f"Warning: alias '{alias}' is already in use")
+            continue
         try:
             app.add_alias(command, alias)
             print(f"Added alias '{alias}' for command '{command}'")
@@ -1,37 +1,110 @@
 """Script for cleaning up temporary files and directories"""
 
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatchcase
 from pathlib import Path
 
+# Names matched exactly, and glob patterns matched against each entry name
+EXACT_PATTERNS = frozenset(
+    {
+        ".pytest_cache",
+        ".coverage",
+        "htmlcov",
+        ".ruff_cache",
+        "__pycache__",
+    }
+)
+GLOB_PATTERNS = ("*.egg-info", "*.dist-info", "*.pyc")
+
+# Removal is syscall-bound and releases the GIL, so a few threads overlap well
+MAX_WORKERS = min(8, os.cpu_count() or 4)
+
+
+def remove_entry(entry: os.DirEntry) -> None:
+    """Remove a file or directory found by the directory walk
+
+    Args:
+        entry (os.DirEntry): The directory entry to remove.
+    """
+    try:
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path, ignore_errors=True)
+        else:
+            os.unlink(entry.path)
+    except OSError:
+        pass
+
 
-def remove_path(path: Path) -> None:
-    """Remove a file or directory
+def remove_path(path: Path) -> bool:
+    """Remove a file or directory, ignoring paths that don't exist
+
+    Symlinks are unlinked rather than followed, and removal errors are ignored.
 
     Args:
         path (Path): The path to the file or directory to remove.
+
+    Returns:
+        bool: True if something was removed, False if the path didn't exist.
     """
-    if path.is_dir():
+    if not os.path.lexists(path):
+        return False
+    if path.is_dir() and not path.is_symlink():
         shutil.rmtree(path, ignore_errors=True)
-    elif path.is_file():
-        path.unlink()
+    else:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+    return True
+
+
+def matches_pattern(name: str) -> bool:
+    """Check whether a file or directory name is a cleanup target
+
+    Args:
+        name (str): The entry name to check.
+
+    Returns:
+        bool: True if the name matches any cleanup pattern, False otherwise.
+    """
+    return name in EXACT_PATTERNS or any(
+        fnmatchcase(name, pattern) for pattern in GLOB_PATTERNS
+    )
+
+
+def find_matches(
+    root: str,
+    matches: list[os.DirEntry],
+    skip: frozenset[str] = frozenset(),
+) -> list[os.DirEntry]:
+    """Collect every matching entry under root in a single directory walk
+
+    Matching directories are collected without being descended into.
+
+    Args:
+        root (str): The directory to walk.
+        matches (list[os.DirEntry]): The list to append matching entries to.
+        skip (frozenset[str]): Paths to leave out of the walk entirely.
+
+    Returns:
+        list[os.DirEntry]: The matches list, for convenience.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.path in skip:
+                continue
+            if matches_pattern(entry.name):
+                matches.append(entry)
+            elif entry.is_dir(follow_symlinks=False):
+                find_matches(entry.path, matches, skip)
+    return matches
 
 
 def clean() -> None:
     """Clean up temporary files and directories"""
     print("\n🧹 Cleaning up temporary files and directories...\n")
-    patterns = [
-        ".pytest_cache",
-        ".coverage",
-        "htmlcov",
-        ".ruff_cache",
-        "__pycache__",
-        "*.egg-info",
-        "*.dist-info",
-        "*.pyc",
-    ]
-    for pattern in patterns:
-        for path in Path(".").rglob(pattern):
-            remove_path(path)
 
     artifacts = [
         Path("dist"),
@@ -40,9 +113,19 @@ def clean() -> None:
         Path(".pypi"),
         Path(".testpypi"),
     ]
-    for path in artifacts:
-        if path.exists():
-            remove_path(path)
+
+    # Artifact directories are removed whole, so don't walk into them
+    skip = frozenset(os.path.join(".", path) for path in artifacts)
+    matches = find_matches(".", [], skip)
+
+    # Targets are disjoint subtrees, so they can be removed concurrently
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        pending_matches = executor.map(remove_entry, matches)
+        removed = list(executor.map(remove_path, artifacts))
+        list(pending_matches)
+
+    for path, was_removed in zip(artifacts, removed):
+        if was_removed:
             print(f"Removed {path}")
 
     print("\n🧹 Cleanup complete!\n")
@@ -27,6 +27,9 @@ def run_command(cmd: list[str], description: str) -> bool:
     except subprocess.CalledProcessError as e:
         print(f"\n❌ {description} failed with exit code {e.returncode}\n")
         return False
+    except FileNotFoundError:
+        print(f"\n❌ {description} failed: {cmd[0]} not found\n")
+        return False
 
 
 def build() -> int:
@@ -54,46 +57,41 @@ def build() -> int:
         return 1
 
     # Step 4: Install package from dist & required dependencies
-    print("\n💾 Installing package from dist")
     wheel_files = list(Path(DIST_DIR).glob("*.whl"))
     if not wheel_files:
         print("\n❌ No wheel file found in dist/")
         return 1
 
+    # Call the venv's executables directly - activation only adjusts PATH
+    venv_bin = Path(TEST_ENV) / "bin"
+    venv_python = str(venv_bin / "python")
     wheel_path = wheel_files[0]
-    pip_cmd = f"source {TEST_ENV}/bin/activate && uv pip install {wheel_path} pytest && uv pip install twine"
-    try:
-        subprocess.run(pip_cmd, shell=True, check=True, executable="/bin/bash")
-        print(f"Installed {wheel_path.name}")
-    except subprocess.CalledProcessError as e:
-        print(f"\n❌ Installation failed with exit code {e.returncode}")
+    install_cmd = ["uv", "pip", "install", "--python", venv_python]
+    if not run_command(
+        [*install_cmd, str(wheel_path), "pytest", "twine"],
+        "💾 Installing package from dist",
+    ):
         return 1
+    print(f"Installed {wheel_path.name}")
 
     # Step 5: Test import
-    print("\n✅ Testing import")
-    import_cmd = f"source {TEST_ENV}/bin/activate && python -c 'import typer_extensions; print(f\"Version: {{typer_extensions.__version__}}\")'"
-    try:
-        subprocess.run(import_cmd, shell=True, check=True, executable="/bin/bash")
-    except subprocess.CalledProcessError as e:
-        print(f"\n❌ Import test failed with exit code {e.returncode}\n")
+    import_check = (
+        "import typer_extensions; print(f'Version: {typer_extensions.__version__}')"
+    )
+    if not run_command([venv_python, "-c", import_check], "✅ Testing import"):
         return 1
 
     # Step 6: Check distribution
-    print("\n🔍 Checking distribution")
-    check_cmd = f"source {TEST_ENV}/bin/activate && twine check {wheel_path}"
-    try:
-        subprocess.run(check_cmd, shell=True, check=True, executable="/bin/bash")
-    except subprocess.CalledProcessError as e:
-        print(f"\n❌ Distribution check failed with exit code {e.returncode}\n")
+    if not run_command(
+        [str(venv_bin / "twine"), "check", str(wheel_path)],
+        "🔍 Checking distribution",
+    ):
         return 1
 
     # Step 7: Run tests
-    print("\n🧪 Running test suite\n")
-    test_cmd = f"source {TEST_ENV}/bin/activate && pytest -v tests/"
-    try:
-        subprocess.run(test_cmd, shell=True, check=True, executable="/bin/bash")
-    except subprocess.CalledProcessError as e:
-        print(f"\n❌ Tests failed with exit code {e.returncode}\n")
+    if not run_command(
+        [str(venv_bin / "pytest"), "-v", "tests/"], "🧪 Running test suite"
+    ):
         return 1
 
     # Success
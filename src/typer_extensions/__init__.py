@@ -6,15 +6,17 @@ from typing import Any
 
 # Apply lazy Rich patch if enabled (opt-out via TYPER_EXTENSIONS_RICH=0)
 if os.environ.get("TYPER_EXTENSIONS_RICH", "1") == "1":  # pragma: no cover
+    _logger = logging.getLogger(__name__)
+
     try:
-        from typer_extensions._patch import apply_rich_patch
+        from typer_extensions._patch import _DEBUG, apply_rich_patch
 
         _patch_applied = apply_rich_patch()
-        if os.environ.get("TYPER_EXTENSIONS_DEBUG") and _patch_applied:
-            logging.getLogger(__name__).debug("Rich patch applied")
+        if _DEBUG and _patch_applied:
+            _logger.debug("Rich patch applied")
 
     except Exception as e:
-        logging.getLogger(__name__).error(f"Failed to apply Rich patch: {e}")
+        _logger.error(f"Failed to apply Rich patch: {e}")
         pass  # Fall back to default behavior
 
 
@@ -69,4 +71,10 @@ def __getattr__(name: str) -> Any:
     """
     import typer
 
-    return getattr(typer, name)
+    value = getattr(typer, name)
+
+    # Cache public names so later lookups are plain module globals (PEP 562)
+    if not name.startswith("__"):
+        globals()[name] = value
+
+    return value
@@ -1,15 +1,21 @@
 """Robust import hook-based patching for enhanced Rich loading."""
 
 import logging
-import os
 import sys
 from importlib.abc import Loader, MetaPathFinder
 from importlib.machinery import ModuleSpec
 from types import ModuleType
-from typing import Optional, Sequence
+from typing import FrozenSet, Optional, Sequence
+
+from typer_extensions._patch import _DEBUG
 
 logger = logging.getLogger(__name__)
 
+_TARGET = "typer.rich_utils"
+
+# Modules the interceptor serves; membership stays one hash lookup as this grows
+_TARGETS: FrozenSet[str] = frozenset({_TARGET})
+
 
 class TyperRichUtilsInterceptor(MetaPathFinder, Loader):
     """Import hook that intercepts typer.rich_utils with enhanced version."""
@@ -35,16 +41,17 @@ class TyperRichUtilsInterceptor(MetaPathFinder, Loader):
         Returns:
             The module spec for typer.rich_utils, or None if not found.
         """
-        if fullname == "typer.rich_utils":
-            spec = ModuleSpec(
-                name="typer.rich_utils",
-                loader=self,
-                origin="typer_extensions._rich_utils (enhanced)",
-                is_package=False,
-            )
-            spec.submodule_search_locations = None
-            return spec
-        return None
+        if fullname not in _TARGETS:
+            return None
+
+        spec = ModuleSpec(
+            name=fullname,
+            loader=self,
+            origin="typer_extensions._rich_utils (enhanced)",
+            is_package=False,
+        )
+        spec.submodule_search_locations = None
+        return spec
 
     def create_module(self, spec: ModuleSpec) -> Optional[ModuleType]:
         """Create the module object.
@@ -72,7 +79,7 @@ class TyperRichUtilsInterceptor(MetaPathFinder, Loader):
 
             # Copy all attributes and fix module metadata
             module.__dict__.update(_rich_utils.__dict__)
-            module.__name__ = "typer.rich_utils"
+            module.__name__ = _TARGET
             module.__package__ = "typer"
             module.__file__ = _rich_utils.__file__
 
@@ -80,7 +87,7 @@ class TyperRichUtilsInterceptor(MetaPathFinder, Loader):
             self._our_module = module
             self._loaded = True
 
-            if os.environ.get("TYPER_EXTENSIONS_DEBUG"):
+            if _DEBUG:
                 logger.info("Rich utils loaded via import hook")
 
         except Exception as e:
@@ -100,9 +107,9 @@ class TyperRichUtilsInterceptor(MetaPathFinder, Loader):
         Returns:
             The loader for the module, or None if not found.
         """
-        if fullname == "typer.rich_utils":
-            return self
-        return None
+        if fullname not in _TARGETS:
+            return None
+        return self
 
     def load_module(self, fullname: str) -> ModuleType:
         """Older import protocol support.
@@ -114,18 +121,18 @@ class TyperRichUtilsInterceptor(MetaPathFinder, Loader):
         Returns:
             The loader for the module, or None if not found.
         """
-        if fullname == "typer.rich_utils":
-            if fullname in sys.modules:
-                return sys.modules[fullname]
+        if fullname not in _TARGETS:
+            raise ImportError(f"Cannot load {fullname}")
 
-            # Create module
-            module = ModuleType(fullname)
-            sys.modules[fullname] = module
+        if fullname in sys.modules:
+            return sys.modules[fullname]
 
-            self.exec_module(module)
-            return module
+        # Create module
+        module = ModuleType(fullname)
+        sys.modules[fullname] = module
 
-        raise ImportError(f"Cannot load {fullname}")
+        self.exec_module(module)
+        return module
 
 
 def install_import_hook() -> bool:
@@ -134,7 +141,7 @@ def install_import_hook() -> bool:
     Returns:
         True if hook installed successfully, False otherwise
     """
-    if "typer.rich_utils" in sys.modules:
+    if _TARGET in sys.modules:
         logger.warning("typer.rich_utils already imported - cannot install hook")
         return False
 
@@ -148,7 +155,7 @@ def install_import_hook() -> bool:
         hook = TyperRichUtilsInterceptor()
         sys.meta_path.insert(0, hook)
 
-        if os.environ.get("TYPER_EXTENSIONS_DEBUG"):
+        if _DEBUG:
             logger.info("Import hook installed successfully")
 
         return True
@@ -170,7 +177,7 @@ def uninstall_import_hook() -> bool:
             sys.meta_path.remove(finder)
             removed = True
 
-    if removed and os.environ.get("TYPER_EXTENSIONS_DEBUG"):
+    if removed and _DEBUG:
         logger.info("Import hook uninstalled")
 
     return removed
@@ -7,15 +7,33 @@ from typing import Any, Dict
 
 logger = logging.getLogger(__name__)
 
+# Read once at import; the hook and patch paths only use it to gate logging
+_DEBUG = bool(os.environ.get("TYPER_EXTENSIONS_DEBUG"))
+
 # Patch state tracking
 PATCH_STATE: Dict[str, Any] = {
     "applied": False,
     "typer_version": None,
-    "patched_functions": [],
+    "patched_functions": (),
     "originals": {},
     "skipped_reason": None,
 }
 
+# State recorded by each successful patch method; originals is supplied per call
+# so PATCH_STATE never shares a mutable dict with these templates
+_HOOK_STATE_UPDATE: Dict[str, Any] = {
+    "applied": True,
+    "method": "import_hook",
+    "patched_functions": ("import hook interceptor",),
+    "skipped_reason": None,
+}
+_INJECTION_STATE_UPDATE: Dict[str, Any] = {
+    "applied": True,
+    "method": "sys_modules_injection",
+    "patched_functions": ("sys.modules pre-injection",),
+    "skipped_reason": None,
+}
+
 
 def apply_rich_patch() -> bool:
     """Apply rich_utils patch to Typer using import hook.
@@ -25,6 +43,8 @@ def apply_rich_patch() -> bool:
     """
     global PATCH_STATE
 
+    modules = sys.modules
+
     # Check if already patched
     if PATCH_STATE["applied"]:
         logger.debug("Rich patch already applied")
@@ -36,7 +56,7 @@ def apply_rich_patch() -> bool:
         logger.debug("Rich patch skipped: opt-out flag set")
         return False
 
-    if "typer.rich_utils" in sys.modules:
+    if "typer.rich_utils" in modules:
         PATCH_STATE["skipped_reason"] = "typer.rich_utils already imported"
         logger.warning("Rich patch skipped: typer.rich_utils already imported")
         return False
@@ -47,17 +67,9 @@ def apply_rich_patch() -> bool:
             from typer_extensions._import_hook import install_import_hook
 
             if install_import_hook():
-                PATCH_STATE.update(
-                    {
-                        "applied": True,
-                        "method": "import_hook",
-                        "patched_functions": ["import hook interceptor"],
-                        "originals": {},
-                        "skipped_reason": None,
-                    }
-                )
-
-                if os.environ.get("TYPER_EXTENSIONS_DEBUG"):
+                PATCH_STATE.update(_HOOK_STATE_UPDATE, originals={})
+
+                if _DEBUG:
                     logger.info(
                         f"Rich patch applied via import hook for Typer {PATCH_STATE['typer_version']}"
                     )
@@ -71,7 +83,7 @@ def apply_rich_patch() -> bool:
             )
 
         # Fallback to sys.modules injection
-        if "typer" in sys.modules:
+        if "typer" in modules:
             PATCH_STATE["skipped_reason"] = (
                 "typer module already imported, cannot apply patch"
             )
@@ -80,31 +92,23 @@ def apply_rich_patch() -> bool:
 
         from typer_extensions import _rich_utils
 
-        if "typer" not in sys.modules:  # pragma: no cover
+        if "typer" not in modules:  # pragma: no cover
             import types
 
             typer_package = types.ModuleType("typer")
             typer_package.__package__ = "typer"
             typer_package.__path__ = []
-            sys.modules["typer"] = typer_package
+            modules["typer"] = typer_package
 
         _rich_utils.__name__ = "typer.rich_utils"
         _rich_utils.__package__ = "typer"
 
-        sys.modules["typer.rich_utils"] = _rich_utils
-        setattr(sys.modules["typer"], "rich_utils", _rich_utils)
+        modules["typer.rich_utils"] = _rich_utils
+        setattr(modules["typer"], "rich_utils", _rich_utils)
 
-        PATCH_STATE.update(
-            {
-                "applied": True,
-                "method": "sys_modules_injection",
-                "patched_functions": ["sys.modules pre-injection"],
-                "originals": {},
-                "skipped_reason": None,
-            }
-        )
+        PATCH_STATE.update(_INJECTION_STATE_UPDATE, originals={})
 
-        if os.environ.get("TYPER_EXTENSIONS_DEBUG"):
+        if _DEBUG:
             logger.info(
                 f"Rich patch applied via sys.modules injection for Typer {PATCH_STATE['typer_version']}"
             )
@@ -141,7 +145,7 @@ def undo_rich_patch() -> None:
         PATCH_STATE.update(
             {
                 "applied": False,
-                "patched_functions": [],
+                "patched_functions": (),
                 "originals": {},
             }
         )
@@ -178,16 +182,9 @@ def get_patch_status() -> str:
     """
     if PATCH_STATE["applied"]:
         version = PATCH_STATE.get("typer_version", "unknown")
-        num_funcs = len(PATCH_STATE.get("patched_functions", []))
+        num_funcs = len(PATCH_STATE.get("patched_functions", ()))
         return f"Applied (Typer {version}, {num_funcs} functions patched)"
     elif PATCH_STATE["skipped_reason"]:
         return f"Skipped: {PATCH_STATE['skipped_reason']}"
     else:
         return "Not applied"
-
-
-# Auto-apply patch on module import (unless opted out)
-_auto_apply = os.environ.get("TYPER_EXTENSIONS_RICH", "1") == "1"
-if _auto_apply and not PATCH_STATE["applied"]:  # pragma: no cover
-    # Note: Actual auto-apply happens in __init__.py to avoid circular imports
-    pass
@@ -7,14 +7,19 @@ that provide support for alias formatting and graceful fallbacks.
 from __future__ import annotations
 
 import io
+import re
 import sys
-from collections import defaultdict
+from functools import lru_cache
 from gettext import gettext as gt
+from itertools import chain
 from os import environ, getenv
 from typing import TYPE_CHECKING, Any, Generator, Literal, Optional, Union
 
 import click
 
+# Bound as a module so tests can patch functions on typer_extensions.format
+from typer_extensions import format as _alias_format
+
 if TYPE_CHECKING:
     from rich.columns import Columns
     from rich.console import Console, RenderableType
@@ -108,6 +113,12 @@ RICH_HELP = gt("Try [blue]'{command_path} {help_option}'[/] for help.")
 MARKUP_MODE_MARKDOWN = "markdown"
 MARKUP_MODE_RICH = "rich"
 _RICH_HELP_PANEL_NAME = "rich_help_panel"
+_NEGATIVE_PREFIXES = ("--no-", "-N")
+# Matches Rich markup tags, for stripping when Rich can't render them
+_RICH_TAG_PATTERN = re.compile(r"\[/?[^\]]+\]")
+
+# Resolved on first use, as typer.core imports this module via typer.rich_utils
+_TYPER_PARAM_TYPES: Optional[tuple[type, ...]] = None
 
 MarkupModeStrict = Literal["markdown", "rich"]
 
@@ -163,6 +174,41 @@ if _USE_RICH:  # pragma: no cover
 ## Core helper functions
 
 
+@lru_cache(maxsize=8)
+def _get_theme(
+    option: str,
+    switch: str,
+    negative_option: str,
+    negative_switch: str,
+    metavar: str,
+    metavar_sep: str,
+    usage: str,
+) -> Theme:
+    """Get the help Theme for the current style settings.
+
+    Building a Theme copies Rich's default styles, so themes are cached and
+    keyed on the style values (which users may reassign at runtime).
+
+    Args:
+        option, switch, negative_option, negative_switch, metavar, metavar_sep,
+        usage: Styles for the matching theme entries
+
+    Returns:
+        Theme instance
+    """
+    return Theme(
+        {
+            "option": option,
+            "switch": switch,
+            "negative_option": negative_option,
+            "negative_switch": negative_switch,
+            "metavar": metavar,
+            "metavar_sep": metavar_sep,
+            "usage": usage,
+        },
+    )
+
+
 def _get_rich_console(stderr: bool = False) -> Optional[Console]:
     """Get Rich Console instance.
 
@@ -176,16 +222,14 @@ def _get_rich_console(stderr: bool = False) -> Optional[Console]:
         return None
 
     return Console(
-        theme=Theme(
-            {
-                "option": STYLE_OPTION,
-                "switch": STYLE_SWITCH,
-                "negative_option": STYLE_NEGATIVE_OPTION,
-                "negative_switch": STYLE_NEGATIVE_SWITCH,
-                "metavar": STYLE_METAVAR,
-                "metavar_sep": STYLE_METAVAR_SEPARATOR,
-                "usage": STYLE_USAGE,
-            },
+        theme=_get_theme(
+            STYLE_OPTION,
+            STYLE_SWITCH,
+            STYLE_NEGATIVE_OPTION,
+            STYLE_NEGATIVE_SWITCH,
+            STYLE_METAVAR,
+            STYLE_METAVAR_SEPARATOR,
+            STYLE_USAGE,
         ),
         highlighter=highlighter,
         color_system=COLOR_SYSTEM,
@@ -208,6 +252,15 @@ def _make_rich_text(
     Returns:
         Markdown or Text object (or plain string if Rich disabled)
     """
+    # Blank help needs no dedenting or markup parsing, but keeps the mode's type:
+    # an empty Markdown renders no lines while an empty Text renders one
+    if not text.strip():
+        if not RICH_AVAILABLE:
+            return ""
+        if markup_mode == MARKUP_MODE_MARKDOWN:
+            return Markdown("", style=style)
+        return Text("", style=style)
+
     # Remove indentations from input text
     text = cleandoc(text)
 
@@ -261,7 +314,7 @@ def _get_help_text(
         help_text = help_text.partition("\f")[0]
 
         # Get the first paragraph
-        first_line, *remaining_paragraphs = help_text.split("\n\n")
+        first_line, sep, remaining_lines = help_text.partition("\n\n")
 
         # Remove single linebreaks
         if markup_mode != MARKUP_MODE_MARKDOWN and not first_line.startswith("\b"):
@@ -274,9 +327,8 @@ def _get_help_text(
         )
 
         # Get remaining lines
-        if remaining_paragraphs:
+        if sep:
             yield Text("")
-            remaining_lines = "\n\n".join(remaining_paragraphs)
             yield _make_rich_text(
                 text=remaining_lines,
                 style=STYLE_HELPTEXT,
@@ -307,8 +359,12 @@ def _get_parameter_help(
         help_record = param.get_help_record(ctx)
         return help_record if help_record else ("", "")
 
-    # Import here to avoid cyclic imports
-    from typer.core import TyperArgument, TyperOption
+    global _TYPER_PARAM_TYPES
+    if _TYPER_PARAM_TYPES is None:
+        # Import here to avoid cyclic imports
+        from typer.core import TyperArgument, TyperOption
+
+        _TYPER_PARAM_TYPES = (TyperArgument, TyperOption)
 
     items: list = []
 
@@ -333,8 +389,7 @@ def _get_parameter_help(
     # Get help text
     help_text = getattr(param, "help", None)
     if help_text:
-        paragraphs = help_text.split("\n\n")
-        first_paragraph, *remaining = paragraphs
+        first_paragraph, sep, remaining_text = help_text.partition("\n\n")
 
         # Remove single linebreaks
         if markup_mode != MARKUP_MODE_MARKDOWN and not first_paragraph.startswith("\b"):
@@ -349,9 +404,8 @@ def _get_parameter_help(
             )
         )
 
-        if remaining:
+        if sep:
             items.append(Text(""))
-            remaining_text = "\n\n".join(remaining)
             items.append(
                 _make_rich_text(
                     text=remaining_text,
@@ -361,7 +415,8 @@ def _get_parameter_help(
             )
 
     # Add default value
-    if isinstance(param, (TyperArgument, TyperOption)):
+    default = param.default
+    if isinstance(param, _TYPER_PARAM_TYPES):
         # Get from typer metadata
         default_value = getattr(param, "default_value_from_help", None)
         if default_value is not None:
@@ -371,15 +426,15 @@ def _get_parameter_help(
                     style=STYLE_OPTION_DEFAULT,
                 )
             )
-    elif param.default is not None and (
+    elif default is not None and (
         getattr(param, "show_default", False) or getattr(ctx, "show_default", False)
     ):
-        if isinstance(param.default, (list, tuple)):
-            default_str = ", ".join(str(d) for d in param.default)
-        elif callable(param.default):
+        if isinstance(default, (list, tuple)):
+            default_str = ", ".join(str(d) for d in default)
+        elif callable(default):
             default_str = "(dynamic)"
         else:
-            default_str = str(param.default)
+            default_str = str(default)
 
         if default_str:
             items.append(
@@ -458,16 +513,14 @@ def _print_options_panel(
     for param in params:
         # Get option names
         if isinstance(param, click.Argument):
-            opts = [param.human_readable_name or param.name or ""]
+            opts_str = param.human_readable_name or param.name or ""
         else:
-            opts = list(param.opts) + list(param.secondary_opts or [])
-
-        opts_str = " / ".join(opts)
+            opts_str = " / ".join(chain(param.opts, param.secondary_opts or ()))
 
         # Check if option is negative
         is_negative = any(
-            opt.startswith("--no-") or opt.startswith("-N")
-            for opt in (param.opts + (param.secondary_opts or []))
+            opt.startswith(_NEGATIVE_PREFIXES)
+            for opt in chain(param.opts, param.secondary_opts or ())
         )
 
         if is_negative:
@@ -542,12 +595,15 @@ def _print_commands_panel(
             click.echo(f"\n{name}:")
             for command in commands:
                 cmd_name = command.name or ""
-                help_text = (command.help or "").partition("\f")[0].splitlines()[0]
+                help_lines = (command.help or "").partition("\f")[0].splitlines()
+                help_text = help_lines[0] if help_lines else ""
                 if command.deprecated:
                     cmd_name += " (deprecated)"
                 click.echo(f"  {cmd_name:<{cmd_len}}  {help_text}")
+        return
 
-    command_display_names: dict[str, str] = {}
+    # Display names line up with commands; aliased panels overwrite them below
+    display_names = [command.name or "" for command in commands]
     max_display_len = cmd_len
 
     if extended_typer is not None:
@@ -555,33 +611,59 @@ def _print_commands_panel(
             extended_typer, "_command_aliases", {}
         ):
             try:
-                cache_key = f"_formatted_commands_cache_{id(commands)}"
-                if not hasattr(extended_typer, cache_key):
-                    from typer_extensions.format import format_commands_with_aliases
-
-                    cmd_tuples = [
-                        (str(getattr(cmd, "name", "")), getattr(cmd, "help", None))
-                        for cmd in commands
-                    ]
-
-                    formatted_tuples, max_len = format_commands_with_aliases(
-                        cmd_tuples,
-                        extended_typer._command_aliases,
-                        display_format=getattr(
-                            extended_typer, "alias_display_format", "({aliases})"
+                command_aliases = extended_typer._command_aliases
+                if not any(cmd.name in command_aliases for cmd in commands):
+                    # Nothing to annotate in this panel, so size it to the plain names
+                    max_display_len = max(
+                        (
+                            _alias_format.calculate_width(cmd.name or "")
+                            for cmd in commands
                         ),
-                        max_num=getattr(extended_typer, "max_num_aliases", 3),
-                        separator=getattr(extended_typer, "alias_separator", ", "),
+                        default=0,
                     )
-
-                    setattr(extended_typer, cache_key, (formatted_tuples, max_len))
-
-                formatted_tuples, max_len = getattr(extended_typer, cache_key)
-
-                for cmd, (formatted_name, _) in zip(commands, formatted_tuples):
-                    command_display_names[cmd.name or ""] = formatted_name
-
-                max_display_len = max_len
+                else:
+                    display_format = getattr(
+                        extended_typer, "alias_display_format", "({aliases})"
+                    )
+                    max_num = getattr(extended_typer, "max_num_aliases", 3)
+                    separator = getattr(extended_typer, "alias_separator", ", ")
+
+                    # Keyed on the panel contents rather than id(commands), which
+                    # a later list can reuse; the alias version detects staleness
+                    cache = extended_typer._formatted_commands_cache
+                    cache_key = (
+                        tuple(cmd.name for cmd in commands),
+                        display_format,
+                        max_num,
+                        separator,
+                    )
+                    alias_version = getattr(extended_typer, "_alias_version", 0)
+                    cached = cache.get(cache_key)
+
+                    if cached is None or cached[0] != alias_version:
+                        cmd_tuples = [
+                            (str(getattr(cmd, "name", "")), getattr(cmd, "help", None))
+                            for cmd in commands
+                        ]
+
+                        cached = (
+                            alias_version,
+                            *_alias_format.format_commands_with_aliases(
+                                cmd_tuples,
+                                command_aliases,
+                                display_format=display_format,
+                                max_num=max_num,
+                                separator=separator,
+                            ),
+                        )
+                        cache[cache_key] = cached
+
+                    _, formatted_tuples, max_len = cached
+
+                    for i, (formatted_name, _) in enumerate(formatted_tuples):
+                        display_names[i] = formatted_name
+
+                    max_display_len = max_len
 
             except Exception:
                 pass
@@ -609,7 +691,7 @@ def _print_commands_panel(
     deprecated_rows = []
     rows = []
 
-    for command in commands:
+    for command, display_name in zip(commands, display_names):
         deprecated_text = Text()
         if command.deprecated:
             deprecated_text = Text(
@@ -618,12 +700,10 @@ def _print_commands_panel(
             )
         deprecated_rows.append(deprecated_text)
 
-        display_name = command_display_names.get(command.name or "", command.name or "")
-
         # Command help
         help_text = command.help or ""
         help_text = help_text.partition("\f")[0]
-        first_line = help_text.split("\n\n")[0] if help_text else ""
+        first_line = help_text.partition("\n\n")[0]
 
         if markup_mode != MARKUP_MODE_MARKDOWN and not first_line.startswith("\b"):
             first_line = first_line.replace("\n", " ")
@@ -690,136 +770,127 @@ def rich_format_help(
         click.echo(formatter.getvalue())
         return
 
-    # Print usage
-    if highlighter is not None:
-        console.print(
-            Padding(highlighter(obj.get_usage(ctx)), 1), style=STYLE_USAGE_COMMAND
-        )
+    # Buffer the whole help so it reaches the terminal in a single write
+    with console:
+        # Print usage
+        if highlighter is not None:
+            console.print(
+                Padding(highlighter(obj.get_usage(ctx)), 1), style=STYLE_USAGE_COMMAND
+            )
 
-    # Print command / group help if applicable
-    if obj.help:
-        console.print(
-            Padding(
-                Align(
-                    _get_help_text(
-                        obj=obj,
-                        markup_mode=markup_mode,
+        # Print command / group help if applicable
+        if obj.help:
+            console.print(
+                Padding(
+                    Align(
+                        _get_help_text(
+                            obj=obj,
+                            markup_mode=markup_mode,
+                        ),
+                        pad=False,
                     ),
-                    pad=False,
-                ),
-                (0, 1, 1, 1),
+                    (0, 1, 1, 1),
+                )
             )
-        )
 
-    # Organise parameters into panels
-    panel_to_arguments: defaultdict[str, list[click.Argument]] = defaultdict(list)
-    panel_to_options: defaultdict[str, list[click.Option]] = defaultdict(list)
+        # Organise parameters into panels
+        panel_to_arguments: dict[str, list[click.Argument]] = {}
+        panel_to_options: dict[str, list[click.Option]] = {}
 
-    for param in obj.get_params(ctx):
-        # Skip if option is hidden
-        if getattr(param, "hidden", False):
-            continue
-        if isinstance(param, click.Argument):
-            panel_name = (
-                getattr(param, _RICH_HELP_PANEL_NAME, None) or ARGUMENTS_PANEL_TITLE
-            )
-            panel_to_arguments[panel_name].append(param)
-        elif isinstance(param, click.Option):
-            panel_name = (
-                getattr(param, _RICH_HELP_PANEL_NAME, None) or OPTIONS_PANEL_TITLE
-            )
-            panel_to_options[panel_name].append(param)
-
-    # Print arguments panels
-    default_arguments = panel_to_arguments.get(ARGUMENTS_PANEL_TITLE, [])
-    _print_options_panel(
-        name=ARGUMENTS_PANEL_TITLE,
-        params=default_arguments,
-        ctx=ctx,
-        markup_mode=markup_mode,
-        console=console,
-    )
-    for panel_name, arguments in panel_to_arguments.items():
-        if panel_name == ARGUMENTS_PANEL_TITLE:
-            continue
+        for param in obj.get_params(ctx):
+            # Skip if option is hidden
+            if getattr(param, "hidden", False):
+                continue
+            if isinstance(param, click.Argument):
+                panel_name = (
+                    getattr(param, _RICH_HELP_PANEL_NAME, None) or ARGUMENTS_PANEL_TITLE
+                )
+                panel_to_arguments.setdefault(panel_name, []).append(param)
+            elif isinstance(param, click.Option):
+                panel_name = (
+                    getattr(param, _RICH_HELP_PANEL_NAME, None) or OPTIONS_PANEL_TITLE
+                )
+                panel_to_options.setdefault(panel_name, []).append(param)
+
+        # Print arguments panels
+        default_arguments = panel_to_arguments.pop(ARGUMENTS_PANEL_TITLE, [])
         _print_options_panel(
-            name=panel_name,
-            params=arguments,
+            name=ARGUMENTS_PANEL_TITLE,
+            params=default_arguments,
             ctx=ctx,
             markup_mode=markup_mode,
             console=console,
         )
+        for panel_name, arguments in panel_to_arguments.items():
+            _print_options_panel(
+                name=panel_name,
+                params=arguments,
+                ctx=ctx,
+                markup_mode=markup_mode,
+                console=console,
+            )
 
-    # Print options panels
-    default_options = panel_to_options.get(OPTIONS_PANEL_TITLE, [])
-    _print_options_panel(
-        name=OPTIONS_PANEL_TITLE,
-        params=default_options,
-        ctx=ctx,
-        markup_mode=markup_mode,
-        console=console,
-    )
-    for panel_name, options in panel_to_options.items():
-        if panel_name == OPTIONS_PANEL_TITLE:
-            continue
+        # Print options panels
+        default_options = panel_to_options.pop(OPTIONS_PANEL_TITLE, [])
         _print_options_panel(
-            name=panel_name,
-            params=options,
+            name=OPTIONS_PANEL_TITLE,
+            params=default_options,
             ctx=ctx,
             markup_mode=markup_mode,
             console=console,
         )
+        for panel_name, options in panel_to_options.items():
+            _print_options_panel(
+                name=panel_name,
+                params=options,
+                ctx=ctx,
+                markup_mode=markup_mode,
+                console=console,
+            )
 
-    # Print commands panels (groups)
-    if isinstance(obj, click.Group):
-        panel_to_commands: defaultdict[str, list[click.Command]] = defaultdict(list)
-        for command_name in obj.list_commands(ctx):
-            command = obj.get_command(ctx, command_name)
-            if command and not command.hidden:
-                panel_name = (
-                    getattr(command, _RICH_HELP_PANEL_NAME, None)
-                    or COMMANDS_PANEL_TITLE
-                )
-                panel_to_commands[panel_name].append(command)
-
-        # Identify the longest command name in all panels
-        max_cmd_len = max(
-            [
-                len(command.name or "")
-                for commands in panel_to_commands.values()
-                for command in commands
-            ],
-            default=0,
-        )
+        # Print commands panels (groups)
+        if isinstance(obj, click.Group):
+            panel_to_commands: dict[str, list[click.Command]] = {}
+            # Longest command name in all panels, tracked while grouping
+            max_cmd_len = 0
+            for command_name in obj.list_commands(ctx):
+                command = obj.get_command(ctx, command_name)
+                if command and not command.hidden:
+                    panel_name = (
+                        getattr(command, _RICH_HELP_PANEL_NAME, None)
+                        or COMMANDS_PANEL_TITLE
+                    )
+                    panel_to_commands.setdefault(panel_name, []).append(command)
+                    cmd_len = len(command.name or "")
+                    if cmd_len > max_cmd_len:
+                        max_cmd_len = cmd_len
 
-        # Print each command group panel
-        default_commands = panel_to_commands.get(COMMANDS_PANEL_TITLE, [])
-        _print_commands_panel(
-            name=COMMANDS_PANEL_TITLE,
-            commands=default_commands,
-            markup_mode=markup_mode,
-            console=console,
-            cmd_len=max_cmd_len,
-            extended_typer=getattr(obj, "_extended_typer", None),
-        )
-        for panel_name, commands in panel_to_commands.items():
-            if panel_name == COMMANDS_PANEL_TITLE:
-                continue
+            # Print each command group panel
+            default_commands = panel_to_commands.pop(COMMANDS_PANEL_TITLE, [])
             _print_commands_panel(
-                name=panel_name,
-                commands=commands,
+                name=COMMANDS_PANEL_TITLE,
+                commands=default_commands,
                 markup_mode=markup_mode,
                 console=console,
                 cmd_len=max_cmd_len,
                 extended_typer=getattr(obj, "_extended_typer", None),
             )
+            for panel_name, commands in panel_to_commands.items():
+                _print_commands_panel(
+                    name=panel_name,
+                    commands=commands,
+                    markup_mode=markup_mode,
+                    console=console,
+                    cmd_len=max_cmd_len,
+                    extended_typer=getattr(obj, "_extended_typer", None),
+                )
 
-    # Epilogue if applicable
-    if obj.epilog:
-        lines = obj.epilog.split("\n\n")
-        epilogue = "\n".join([x.replace("\n", " ").strip() for x in lines])
-        epilogue_text = _make_rich_text(text=epilogue, markup_mode=markup_mode)
-        console.print(Padding(Align(epilogue_text, pad=False), 1))
+        # Epilogue if applicable
+        if obj.epilog:
+            lines = obj.epilog.split("\n\n")
+            epilogue = "\n".join([x.replace("\n", " ").strip() for x in lines])
+            epilogue_text = _make_rich_text(text=epilogue, markup_mode=markup_mode)
+            console.print(Padding(Align(epilogue_text, pad=False), 1))
 
 
 def rich_format_error(self: click.ClickException) -> None:
@@ -888,10 +959,12 @@ def rich_abort_error() -> None:
 ## Utility functions
 
 
+@lru_cache(maxsize=1024)
 def cleandoc(doc: str) -> str:
     """Remove any whitespace from the second line onwards.
 
-    Adapted from inspect.cleandoc()
+    Adapted from inspect.cleandoc(). Results are cached, as the same help
+    strings are cleaned several times per help render.
 
     Args:
         doc: The docstring to clean up.
@@ -977,17 +1050,13 @@ def rich_render_text(text: str) -> str:
     """
     if not RICH_AVAILABLE:
         # Fallback to simple tag removal of Rich tags
-        import re
-
-        text = re.sub(r"\[/?[^\]]+\]", "", text)
+        text = _RICH_TAG_PATTERN.sub("", text)
         return text.rstrip("\n")
 
     console = _get_rich_console()
     if not console:
         # Fallback to plain text
-        import re
-
-        text = re.sub(r"\[/?[^\]]+\]", "", text)
+        text = _RICH_TAG_PATTERN.sub("", text)
         return text.rstrip("\n")
 
     return "".join(segment.text for segment in console.render(text)).rstrip("\n")
@@ -1,6 +1,8 @@
 """Core ExtendedTyper class extending typer.Typer with alias support"""
 
 import re
+import sys
+from functools import lru_cache
 from typing import Any, Callable, Optional, Protocol, Union, cast
 
 import typer
@@ -10,7 +12,22 @@ from click.core import Context
 from typer.core import TyperGroup
 from typer.models import Default
 
-_ALIAS_PATTERN = re.compile(r"^[\w\-]+$", re.UNICODE)
+_ALIAS_PATTERN = re.compile(r"[\w\-]+", re.UNICODE)
+
+_DEFAULT_ALIAS_DISPLAY_FORMAT = "({aliases})"
+
+
+@lru_cache(maxsize=256)
+def _casefold(name: str) -> str:
+    """Casefold a command/alias name, memoised for names seen repeatedly
+
+    Args:
+        name: The command/alias name to casefold
+
+    Returns:
+        The casefolded name
+    """
+    return name.casefold()
 
 
 class HasName(Protocol):
@@ -47,13 +64,16 @@ class ExtendedGroup(TyperGroup):
         Returns:
             The command if found, None otherwise
         """
-        if self._extended_typer is None:
+        # Primary command names are the common case, so skip alias resolution for them
+        extended_typer = self._extended_typer
+        if extended_typer is None or cmd_name in self.commands:
             return super().get_command(ctx, cmd_name)
 
-        # Try to resolve as an active alias first
-        primary_cmd = self._extended_typer._resolve_alias(cmd_name)
-        if primary_cmd is not None:
-            cmd_name = primary_cmd
+        # Aliases may all have been removed since the group was built
+        if extended_typer._alias_to_command:
+            primary_cmd = extended_typer._resolve_alias(cmd_name)
+            if primary_cmd is not None:
+                cmd_name = primary_cmd
 
         return super().get_command(ctx, cmd_name)
 
@@ -85,36 +105,11 @@ def _extended_get_group_from_info(
         if not extended_typer._alias_to_command:
             return group  # No aliases registered, return standard group
 
-        typer_group_kwargs = {
-            "name": group.name,
-            "callback": group.callback,
-            "params": group.params,
-            "help": group.help,
-            "epilog": group.epilog,
-            "short_help": group.short_help,
-            "options_metavar": group.options_metavar,
-            "subcommand_metavar": group.subcommand_metavar,
-            "chain": group.chain,
-            "result_callback": group.result_callback,
-            "context_settings": group.context_settings,
-        }
-
-        if hasattr(group, "__dict__"):
-            if "rich_markup_mode" in group.__dict__:
-                typer_group_kwargs["rich_markup_mode"] = group.__dict__[
-                    "rich_markup_mode"
-                ]
-            if "rich_help_panel" in group.__dict__:
-                typer_group_kwargs["rich_help_panel"] = group.__dict__[
-                    "rich_help_panel"
-                ]
-
-        extended_group = ExtendedGroup(
-            **typer_group_kwargs,
-            extended_typer=extended_typer,
-        )
-
-        extended_group.commands = group.commands
+        # Adopt the built group's full state in one step, so every attribute Typer
+        # and Click set (including flags like invoke_without_command) carries over
+        extended_group = ExtendedGroup.__new__(ExtendedGroup)
+        extended_group.__dict__.update(vars(group))
+        extended_group._extended_typer = extended_typer
 
         return extended_group
 
@@ -174,7 +169,7 @@ class ExtendedTyper(typer.Typer):
         *args: Any,
         alias_case_sensitive: Optional[bool] = None,
         show_aliases_in_help: bool = True,
-        alias_display_format: str = "({aliases})",
+        alias_display_format: str = _DEFAULT_ALIAS_DISPLAY_FORMAT,
         alias_separator: str = ", ",
         max_num_aliases: int = 3,
         **kwargs: Any,
@@ -191,7 +186,19 @@ class ExtendedTyper(typer.Typer):
             alias_separator: Separator for displaying aliases in help (default: ', ')
             max_num_aliases: Maximum number of aliases to display before truncating with '+ N more'
             **kwargs: Keyword arguments for Typer
+
+        Raises:
+            ValueError: If alias_display_format doesn't include the '{aliases}' placeholder
         """
+        # The default is known to be valid, so only custom formats load the formatter
+        if alias_display_format != _DEFAULT_ALIAS_DISPLAY_FORMAT:
+            from typer_extensions.format import _has_aliases_placeholder
+
+            if not _has_aliases_placeholder(alias_display_format):
+                raise ValueError(
+                    "alias_display_format must include the '{aliases}' placeholder"
+                )
+
         super().__init__(*args, **kwargs)
 
         # Sync with Typer's case_sensitive setting if not explicitly set
@@ -211,6 +218,19 @@ class ExtendedTyper(typer.Typer):
         self._command_aliases: dict[str, list[str]] = {}
         self._alias_to_command: dict[str, str] = {}
 
+        # Normalised alias -> alias as registered, for removal in any case
+        self._alias_originals: dict[str, str] = {}
+
+        # Click objects built lazily on the first programmatic command lookup
+        self._group: Optional[Group] = None
+        self._command: Optional[Command] = None
+
+        # Bumped on every alias mutation so derived caches can detect staleness
+        self._alias_version = 0
+
+        # Formatted command panels for help, keyed on the panel's command names
+        self._formatted_commands_cache: dict[tuple, tuple] = {}
+
     def _normalise_name(self, name: str) -> str:
         """Normalise command/alias name based on case sensitivity
 
@@ -218,27 +238,33 @@ class ExtendedTyper(typer.Typer):
             name: The command/alias name to normalise
 
         Returns:
-            The normalised command/alias name (lowercase if case insensitive)
+            The normalised command/alias name (casefolded if case insensitive)
         """
-        return name.lower() if not self._alias_case_sensitive else name
+        if self._alias_case_sensitive:
+            return name
 
-    def _register_alias(self, command_name: str, alias: str) -> None:
-        """Register an alias for a command
+        return _casefold(name)
+
+    def _validate_alias(self, command_name: str, alias: str) -> str:
+        """Validate an alias for a command without registering it
 
         Args:
             command_name: The name of the command
-            alias: The alias to register
+            alias: The alias to validate
+
+        Returns:
+            The normalised alias
 
         Raises:
-            ValueError: If the alias conflicts with an existing command/alias
+            ValueError: If the alias is invalid or conflicts with an existing command/alias
         """
         if not alias or not isinstance(alias, str):
             raise ValueError("Alias must be a non-empty string")
 
-        if any(c.isspace() for c in alias):
-            raise ValueError("Alias cannot contain whitespace")
-
-        if not _ALIAS_PATTERN.match(alias):
+        # Single regex pass; the string is only inspected further to pick the error
+        if not _ALIAS_PATTERN.fullmatch(alias):
+            if any(c.isspace() for c in alias):
+                raise ValueError("Alias cannot contain whitespace")
             raise ValueError(
                 "Alias must only contain alphanumeric characters, dashes, and underscores (Unicode allowed)"
             )
@@ -257,13 +283,54 @@ class ExtendedTyper(typer.Typer):
                 f"Alias '{alias}' is already registered for command '{existing_cmd}'"
             )
 
-        # Register the alias
-        self._alias_to_command[normalised_alias] = command_name
+        return normalised_alias
+
+    def _register_aliases(self, command_name: str, aliases: list[str]) -> None:
+        """Register several aliases for a command at once
+
+        Every alias is validated before any is stored, so a conflict leaves the
+        registry unchanged
+
+        Args:
+            command_name: The name of the command
+            aliases: The aliases to register, in display order
+
+        Raises:
+            ValueError: If any alias conflicts with an existing command/alias or
+                appears twice in the batch
+        """
+        # Normalised alias -> alias as registered, interned so lookups of the
+        # same literals compare by identity
+        pending: dict[str, str] = {}
+        for alias in aliases:
+            normalised_alias = self._validate_alias(command_name, alias)
+            if normalised_alias in pending:
+                raise ValueError(
+                    f"Alias '{alias}' is already registered for command '{command_name}'"
+                )
+            pending[sys.intern(normalised_alias)] = sys.intern(str(alias))
+
+        if not pending:
+            return
+
+        command_name = sys.intern(str(command_name))
 
-        # Add alias to command mapping
-        if command_name not in self._command_aliases:
-            self._command_aliases[command_name] = []
-        self._command_aliases[command_name].append(alias)
+        self._alias_to_command.update(dict.fromkeys(pending, command_name))
+        self._alias_originals.update(pending)
+        self._command_aliases.setdefault(command_name, []).extend(pending.values())
+        self._alias_version += len(pending)
+
+    def _register_alias(self, command_name: str, alias: str) -> None:
+        """Register an alias for a command
+
+        Args:
+            command_name: The name of the command
+            alias: The alias to register
+
+        Raises:
+            ValueError: If the alias conflicts with an existing command/alias
+        """
+        self._register_aliases(command_name, [alias])
 
     def _register_command_with_aliases(
         self,
@@ -290,8 +357,7 @@ class ExtendedTyper(typer.Typer):
 
         cmd = super().command(name, **kwargs)(func)
 
-        for alias in aliases:
-            self._register_alias(name, alias)
+        self._register_aliases(name, aliases)
 
         return cmd
 
@@ -318,22 +384,21 @@ class ExtendedTyper(typer.Typer):
         Returns:
             The command if found, else None
         """
-        if getattr(self, "_group", None) is None:
-            if getattr(self, "_command", None) is None:
-                # Trigger CLI build
-                click_obj = typer.main.get_command(self)
+        if self._group is None and self._command is None:
+            # Trigger CLI build
+            click_obj = typer.main.get_command(self)
 
-                if hasattr(click_obj, "commands"):
-                    self._group = click_obj
-                else:
-                    self._command = click_obj
+            if hasattr(click_obj, "commands"):
+                self._group = cast(Group, click_obj)
+            else:
+                self._command = click_obj
 
         primary_cmd = self._resolve_alias(cmd_name)
         effective_name = primary_cmd if primary_cmd is not None else cmd_name
 
         # Single command apps
-        if hasattr(self, "_command"):
-            command = self._command
+        command = self._command
+        if command is not None:
             if command.name == effective_name:
                 return command
             return None
@@ -371,6 +436,9 @@ class ExtendedTyper(typer.Typer):
                 func, name=cast(HasName, func).__name__, aliases=None, **kwargs
             )
 
+        # Resolve an explicit name once, rather than inside the decorator
+        explicit_name = name if isinstance(name, str) and name else None
+
         def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
             """Decorator to register a command with aliases
 
@@ -380,13 +448,11 @@ class ExtendedTyper(typer.Typer):
             Returns:
                 The registered command function
             """
-            if isinstance(name, str) and name:
-                command_name = name
-            else:
-                command_name = cast(HasName, func).__name__
-
             return self._register_command_with_aliases(
-                func, name=command_name, aliases=aliases, **kwargs
+                func,
+                name=explicit_name or cast(HasName, func).__name__,
+                aliases=aliases,
+                **kwargs,
             )
 
         return decorator
@@ -433,18 +499,67 @@ class ExtendedTyper(typer.Typer):
         Raises:
             ValueError: If the command doesn't exist, is a single-command app, or the alias conflicts with existing commands/aliases
         """
-        # Get the underlying Click group
-        click_obj = typer.main.get_command(self)
+        # Reject duplicates before building the Click group, which is the costly part
+        if isinstance(alias, str) and self.has_alias(alias):
+            existing_cmd = self._alias_to_command[self._normalise_name(alias)]
+            raise ValueError(
+                f"Alias '{alias}' is already registered for command '{existing_cmd}'"
+            )
 
-        if not isinstance(click_obj, Group):
+        if self._is_single_command_app():
             raise ValueError("Cannot add aliases to single-command applications")
 
-        existing_command = click_obj.get_command(Context(click_obj), command_name)
-        if existing_command is None:
-            raise ValueError(f"Command '{command_name}' does not exist")
+        # Only build the Click group for names Typer infers, e.g. nameless sub-apps
+        if not self._is_registered_name(command_name):
+            click_obj = typer.main.get_command(self)
+
+            if not isinstance(click_obj, Group):
+                raise ValueError("Cannot add aliases to single-command applications")
+
+            existing_command = click_obj.get_command(Context(click_obj), command_name)
+            if existing_command is None:
+                raise ValueError(f"Command '{command_name}' does not exist")
 
         self._register_alias(command_name, alias)
 
+    def _is_single_command_app(self) -> bool:
+        """Check whether Typer will build this app as a single command, not a group
+
+        Mirrors the checks typer.main.get_command makes, without building anything
+
+        Returns:
+            True if the app has exactly one command and nothing that requires a group
+        """
+        return (
+            len(self.registered_commands) == 1
+            and not self.registered_groups
+            and not self.registered_callback
+            and not self.info.callback
+        )
+
+    def _is_registered_name(self, name: str) -> bool:
+        """Check Typer's registries for a command or sub-app with the given name
+
+        Args:
+            name: The command name to look for
+
+        Returns:
+            True if a registered command or explicitly named sub-app has the name
+        """
+        for command_info in self.registered_commands:
+            command_name = command_info.name
+            if command_name is None and command_info.callback is not None:
+                command_name = typer.main.get_command_name(
+                    cast(HasName, command_info.callback).__name__
+                )
+            if command_name == name:
+                return True
+
+        return any(
+            isinstance(group_info.name, str) and group_info.name == name
+            for group_info in self.registered_groups
+        )
+
     def remove_alias(self, alias: str) -> bool:
         """Programmatically remove an alias from an existing command
 
@@ -456,15 +571,19 @@ class ExtendedTyper(typer.Typer):
         """
         normalised_alias = self._normalise_name(alias)
 
-        if normalised_alias not in self._alias_to_command:
+        # Single hash probe: pop both checks membership and removes the entry
+        primary_name = self._alias_to_command.pop(normalised_alias, None)
+        if primary_name is None:
             return False
 
-        primary_name = self._alias_to_command[normalised_alias]
-        del self._alias_to_command[normalised_alias]
+        self._alias_version += 1
+
+        # The display list holds the alias as registered, which may differ in case
+        original_alias = self._alias_originals.pop(normalised_alias, alias)
 
         if primary_name in self._command_aliases:
             try:
-                self._command_aliases[primary_name].remove(alias)
+                self._command_aliases[primary_name].remove(original_alias)
 
                 if not self._command_aliases[primary_name]:
                     del self._command_aliases[primary_name]
@@ -474,6 +593,17 @@ class ExtendedTyper(typer.Typer):
 
         return True
 
+    def has_alias(self, alias: str) -> bool:
+        """Check whether an alias is registered, respecting case sensitivity
+
+        Args:
+            alias: The alias to check
+
+        Returns:
+            True if the alias is registered for any command, False otherwise
+        """
+        return self._normalise_name(alias) in self._alias_to_command
+
     def get_aliases(self, command_name: str) -> list[str]:
         """Retrieve the list of aliases for a given command
 
@@ -483,9 +613,8 @@ class ExtendedTyper(typer.Typer):
         Returns:
             A list of aliases for the command, or an empty list if no aliases or command doesn't exist
         """
-        if command_name in self._command_aliases:
-            return self._command_aliases[command_name].copy()
-        return []
+        aliases = self._command_aliases.get(command_name)
+        return aliases.copy() if aliases is not None else []
 
     def list_commands_with_aliases(self) -> dict[str, list[str]]:
         """List all aliased commands and their aliases
@@ -580,5 +709,4 @@ class ExtendedTyper(typer.Typer):
 
         if aliases:
             sub_name = self._resolve_sub_typer_name(typer_instance, name)
-            for alias in aliases:
-                self._register_alias(sub_name, alias)
+            self._register_aliases(sub_name, aliases)
@@ -1,10 +1,14 @@
 """Help text formatting utilities"""
 
 from collections.abc import Sequence
-from typing import Union
+from functools import lru_cache
+from string import Formatter
+from typing import Optional, Union
 
 from wcwidth import wcswidth
 
+_FORMATTER = Formatter()
+
 
 def truncate_aliases(
     aliases: list[str],
@@ -37,9 +41,92 @@ def truncate_aliases(
     return f"{separator.join(visible)}{separator if visible else ''}+{hidden} more"
 
 
+def _has_aliases_placeholder(display_format: str) -> bool:
+    """Check whether an alias display format has an '{aliases}' replacement field
+
+    Uses the same parser as _compile_display_format, so escaped braces such as
+    '{{aliases}}' don't count, while any field str.format can fill from 'aliases'
+    does, including '{aliases:>12}' and '{aliases[0]}' which aren't precompiled
+
+    Args:
+        display_format: The format string for displaying aliases
+
+    Returns:
+        True if the format has a field for 'aliases', otherwise False
+
+    Raises:
+        ValueError: If the format string is malformed
+    """
+    return any(
+        field_name is not None
+        and field_name.partition(".")[0].partition("[")[0] == "aliases"
+        for _, field_name, _, _ in _FORMATTER.parse(display_format)
+    )
+
+
+@lru_cache(maxsize=32)
+def _compile_display_format(display_format: str) -> Optional[tuple[str, ...]]:
+    """Split an alias display format into the literal parts around '{aliases}'
+
+    Only formats whose fields are all a bare '{aliases}' can be split, as a format
+    spec, conversion or attribute access has to be applied to the real aliases
+    string; those formats return None and are rendered with str.format instead
+
+    Args:
+        display_format: The format string for displaying aliases
+
+    Returns:
+        The literal parts of the format, e.g. ('(', ')') for '({aliases})', or None
+        if the format can't be precompiled
+    """
+    parts: list[str] = []
+    literal = ""
+    for text, field_name, format_spec, conversion in _FORMATTER.parse(display_format):
+        literal += text
+        if field_name is None:
+            continue
+        if field_name != "aliases" or format_spec or conversion:
+            return None
+        parts.append(literal)
+        literal = ""
+
+    parts.append(literal)
+    return tuple(parts)
+
+
+@lru_cache(maxsize=256)
+def _format_alias_display(
+    aliases: tuple[str, ...],
+    display_format: str,
+    separator: str,
+    max_num: int,
+) -> str:
+    """Build the alias fragment shown next to a command in help output
+
+    Memoised on the (hashable) inputs so repeated help renders reuse the string
+
+    Args:
+        aliases: The aliases for the command, in display order
+        display_format: The format string for displaying aliases
+        separator: The separator to use between aliases
+        max_num: The maximum number of aliases to display
+
+    Returns:
+        The formatted alias fragment, e.g. '(ls, l)'
+    """
+    aliases_str = truncate_aliases(list(aliases), max_num=max_num, separator=separator)
+    parts = _compile_display_format(display_format)
+    if parts is None:
+        return display_format.format(aliases=aliases_str)
+    return aliases_str.join(parts)
+
+
+@lru_cache(maxsize=1024)
 def calculate_width(text: str) -> int:
     """Calculate the display width of a string
 
+    Memoised, as the same command and alias names are measured on every help render
+
     Args:
         text: The text to measure
 
@@ -89,13 +176,14 @@ def format_commands_with_aliases(
         cmd_widths[cmd_name] = cmd_width
         max_cmd_length = max(max_cmd_length, cmd_width)
 
-        if cmd_name in command_aliases:
-            aliases_str = truncate_aliases(
-                command_aliases[cmd_name],
-                max_num=max_num,
-                separator=separator,
+        aliases = command_aliases.get(cmd_name)
+        if aliases is not None:
+            aliases_display = _format_alias_display(
+                tuple(aliases),
+                display_format,
+                separator,
+                max_num,
             )
-            aliases_display = display_format.format(aliases=aliases_str)
             alias_displays[cmd_name] = aliases_display
             alias_width = calculate_width(aliases_display)
             alias_widths[cmd_name] = alias_width
@@ -105,20 +193,23 @@ def format_commands_with_aliases(
     max_formatted_length = 0
 
     for cmd_name, help_text in commands:
-        if cmd_name in command_aliases:
+        aliases_display = alias_displays.get(cmd_name)
+        if aliases_display is not None:
             cmd_width = cmd_widths[cmd_name]
             alias_width = alias_widths[cmd_name]
 
-            padded_cmd = cmd_name + " " * (max_cmd_length - cmd_width)
-            aliases_display = alias_displays[cmd_name]
-            padded_aliases = aliases_display + " " * (max_aliases_length - alias_width)
+            # ljust counts characters, so pad by the display-width shortfall
+            padded_cmd = cmd_name.ljust(len(cmd_name) + max_cmd_length - cmd_width)
+            padded_aliases = aliases_display.ljust(
+                len(aliases_display) + max_aliases_length - alias_width
+            )
 
             formatted_cmd = f"{padded_cmd}   {padded_aliases}"
             formatted_cmd_length = calculate_width(formatted_cmd)
             max_formatted_length = max(max_formatted_length, formatted_cmd_length)
         else:
             formatted_cmd = cmd_name
-            formatted_cmd_length = cmd_width
+            formatted_cmd_length = cmd_widths[cmd_name]
             max_formatted_length = max(max_formatted_length, formatted_cmd_length)
 
         formatted_cmds.append((formatted_cmd, help_text))
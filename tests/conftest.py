@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
@@ -14,6 +15,9 @@ from typer.testing import CliRunner
 # Get the project root
 PROJECT_ROOT = Path(__file__).parent.parent
 
+# ANSI escape sequences (CSI codes and two-character escapes)
+ANSI_PATTERN = re.compile(r"\x1b\[[^\]]*?[@-~]|\x1b[^\[]")
+
 
 def strip_ansi_codes(text: str) -> str:
     """Remove ANSI escape codes from text for consistent assertion testing
@@ -28,8 +32,13 @@ def strip_ansi_codes(text: str) -> str:
     Returns:
         The text with all ANSI escape codes removed
     """
-    ansi_pattern = re.compile(r"\x1b\[[^\]]*?[@-~]|\x1b[^\[]")
-    return ansi_pattern.sub("", text)
+    return ANSI_PATTERN.sub("", text)
+
+
+@lru_cache(maxsize=None)
+def _formatted_command_pattern(command: str, aliases: str) -> re.Pattern[str]:
+    """Compile the pattern matching a command followed by its aliases"""
+    return re.compile(rf"{re.escape(command)}\s+.*?{re.escape(aliases)}")
 
 
 def assert_formatted_command(
@@ -45,8 +54,8 @@ def assert_formatted_command(
         aliases: The expected aliases for the command.
         separator: The separator used between aliases.
     """
-    pattern = rf"{re.escape(command)}\s+.*?{re.escape(aliases)}"
-    assert re.search(pattern, output), (
+    pattern = _formatted_command_pattern(command, aliases)
+    assert pattern.search(output), (
         f"Command '{command}' with aliases '{aliases}' not found in output.\n"
         f"Output:\n{output}"
     )
@@ -508,3 +508,62 @@ class TestHelpRealWorldScenarios:
         # Should still show help text, though aliases may not be formatted
         assert "list" in clean_result
         assert "delete" in clean_result
+
+
+class TestLazyHelpFormatting:
+    """Tests that alias help formatting is only done when help is rendered."""
+
+    CODE = """
+import json
+import sys
+
+from typer.testing import CliRunner
+
+from typer_extensions import ExtendedTyper
+
+app = ExtendedTyper()
+
+
+@app.command("list", aliases=["ls", "l"])
+def list_items():
+    \"\"\"List all items.\"\"\"
+    print("listing")
+
+
+@app.command("delete", aliases=["rm"])
+def delete_item():
+    \"\"\"Delete an item.\"\"\"
+    print("deleting")
+
+
+result = CliRunner().invoke(app, sys.argv[1:])
+print(json.dumps({
+    "exit_code": result.exit_code,
+    "format_loaded": "typer_extensions.format" in sys.modules,
+    "rich_utils_loaded": "typer.rich_utils" in sys.modules,
+}))
+"""
+
+    def _run(self, subprocess_runner, *args):
+        import json
+
+        code = self.CODE.replace("sys.argv[1:]", repr(list(args)))
+        result = subprocess_runner(code)
+        assert result.returncode == 0, result.stderr
+        return json.loads(result.stdout.strip().splitlines()[-1])
+
+    def test_command_invocation_skips_help_formatting(self, subprocess_runner):
+        """Test that running a command never loads the help/alias formatters."""
+        output = self._run(subprocess_runner, "ls")
+
+        assert output["exit_code"] == 0
+        assert output["format_loaded"] is False
+        assert output["rich_utils_loaded"] is False
+
+    def test_help_loads_help_formatting(self, subprocess_runner):
+        """Test that --help is what pulls in the alias formatters."""
+        output = self._run(subprocess_runner, "--help")
+
+        assert output["exit_code"] == 0
+        assert output["format_loaded"] is True
+        assert output["rich_utils_loaded"] is True
@@ -4,6 +4,7 @@ import pytest
 from unittest.mock import MagicMock, patch
 
 from typer_extensions import ExtendedTyper
+from typer_extensions.core import _casefold
 
 
 class TestExtendedTyperinitialisation:
@@ -16,6 +17,8 @@ class TestExtendedTyperinitialisation:
         assert app.show_aliases_in_help is True
         assert app._command_aliases == {}
         assert app._alias_to_command == {}
+        assert app._group is None
+        assert app._command is None
 
     def test_custom_configuration(self):
         """Test that custom configuration is stored"""
@@ -26,6 +29,23 @@ class TestExtendedTyperinitialisation:
         assert app._alias_case_sensitive is False
         assert app.show_aliases_in_help is False
 
+    def test_display_format_without_placeholder_raises(self):
+        """Test that an alias display format missing '{aliases}' is rejected"""
+        with pytest.raises(ValueError, match="must include the '{aliases}'"):
+            ExtendedTyper(alias_display_format="[aliases]")
+
+    def test_display_format_with_escaped_placeholder_raises(self):
+        """Test that an escaped '{{aliases}}' doesn't count as the placeholder"""
+        with pytest.raises(ValueError, match="must include the '{aliases}'"):
+            ExtendedTyper(alias_display_format="{{aliases}}")
+
+    def test_display_format_with_format_spec_accepted(self):
+        """Test that an '{aliases}' field with a format spec or conversion is valid"""
+        app = ExtendedTyper(alias_display_format="{aliases:>12}")
+        assert app.alias_display_format == "{aliases:>12}"
+
+        ExtendedTyper(alias_display_format="({aliases!s})")
+
 
 class TestNameNormalisation:
     """Tests for name normalisation based on case sensitivity"""
@@ -42,6 +62,27 @@ class TestNameNormalisation:
         assert app._normalise_name("List") == "list"
         assert app._normalise_name("LIST") == "list"
 
+    def test_normalise_case_insensitive_unicode(self):
+        """Test case-insensitive normalisation folds non-ASCII case variants"""
+        app = ExtendedTyper(alias_case_sensitive=False)
+        assert app._normalise_name("STRASSE") == app._normalise_name("straße")
+        assert app._normalise_name("ΣΊΣΥΦΟΣ") == app._normalise_name("σίσυφος")
+
+    def test_normalise_case_insensitive_is_memoised(self):
+        """Test case-insensitive normalisation reuses the cached result"""
+        app = ExtendedTyper(alias_case_sensitive=False)
+        _casefold.cache_clear()
+        first = app._normalise_name("List")
+        assert app._normalise_name("List") is first
+        assert _casefold.cache_info().hits == 1
+
+    def test_normalise_case_sensitive_skips_cache(self):
+        """Test case-sensitive normalisation doesn't populate the cache"""
+        app = ExtendedTyper(alias_case_sensitive=True)
+        _casefold.cache_clear()
+        app._normalise_name("List")
+        assert _casefold.cache_info().currsize == 0
+
 
 class TestAliasRegistration:
     """Tests for alias registration logic"""
@@ -74,6 +115,26 @@ class TestAliasRegistration:
         with pytest.raises(ValueError, match="already registered"):
             app._register_alias("delete", "ls")
 
+    def test_register_aliases_batch_is_atomic(self):
+        """Test that a conflicting alias leaves the rest of the batch unregistered"""
+        app = ExtendedTyper()
+        app._register_alias("delete", "rm")
+
+        with pytest.raises(ValueError, match="already registered"):
+            app._register_aliases("list", ["ls", "rm"])
+
+        assert "list" not in app._command_aliases
+        assert "ls" not in app._alias_to_command
+
+    def test_register_aliases_rejects_duplicates_in_batch(self):
+        """Test that repeating an alias within one batch raises ValueError"""
+        app = ExtendedTyper()
+
+        with pytest.raises(ValueError, match="already registered for command 'list'"):
+            app._register_aliases("list", ["ls", "ls"])
+
+        assert app._alias_to_command == {}
+
     def test_alias_same_as_primary_raises(self):
         """Test that alias matching primary name raises ValueError"""
         app = ExtendedTyper()
@@ -406,6 +467,44 @@ class TestExtendedGroup:
 
         assert group.get_command(ctx, "ls") is not None
 
+    def test__get_command_by_primary_name_skips_alias_resolution(self):
+        """Test ExtendedGroup finds primary names without resolving aliases"""
+        from typer_extensions.core import Context, ExtendedGroup
+
+        app = ExtendedTyper()
+
+        def list_items():
+            """List items."""
+            pass
+
+        app._register_command_with_aliases(list_items, "list", aliases=["ls"])
+        group = ExtendedGroup(extended_typer=app)
+        ctx = Context(group)
+        cmd = app._get_command(ctx, "list")
+        assert cmd is not None
+        group.add_command(cmd, name="list")
+
+        with patch.object(app, "_resolve_alias", wraps=app._resolve_alias) as resolve:
+            assert group.get_command(ctx, "list") is cmd
+            resolve.assert_not_called()
+
+            assert group.get_command(ctx, "ls") is cmd
+            resolve.assert_called_once_with("ls")
+
+    def test__get_command_skips_resolution_without_aliases(self):
+        """Test ExtendedGroup skips alias resolution once every alias is removed"""
+        from typer_extensions.core import Context, ExtendedGroup
+
+        app = ExtendedTyper()
+        app._register_alias("list", "ls")
+        group = ExtendedGroup(extended_typer=app)
+        ctx = Context(group)
+        app.remove_alias("ls")
+
+        with patch.object(app, "_resolve_alias") as resolve:
+            assert group.get_command(ctx, "ls") is None
+            resolve.assert_not_called()
+
     def test__get_command_with_unknown_command(self):
         """Test ExtendedGroup returns None for unknown command/alias"""
         from typer_extensions.core import Context, ExtendedGroup
@@ -573,6 +672,14 @@ class TestRegisterAliasValidation:
         with pytest.raises(ValueError, match="Alias cannot contain whitespace"):
             app._register_alias("list", "l\ts")
 
+    def test_register_alias_with_trailing_newline(self):
+        """Test that a trailing newline is rejected rather than matched by '$'"""
+        app = ExtendedTyper()
+
+        with pytest.raises(ValueError, match="Alias cannot contain whitespace"):
+            app._register_alias("list", "ls\n")
+        assert app._alias_to_command == {}
+
     def test_register_alias_with_invalid_characters(self):
         """Test that alias with invalid characters raises ValueError"""
         app = ExtendedTyper()
@@ -675,6 +782,53 @@ class TestRemoveAliasEdgeCases:
         assert result is True
 
 
+class TestAliasInterning:
+    """Tests for interning of stored alias and command names"""
+
+    def test_stored_names_are_interned(self):
+        """Test that registered names are stored as interned strings"""
+        import sys
+
+        app = ExtendedTyper(alias_case_sensitive=False)
+        alias = "".join(["L", "s"])
+        app._register_alias("list", alias)
+
+        (key,) = app._alias_to_command
+        assert key is sys.intern("ls")
+        assert app._alias_to_command[key] is sys.intern("list")
+        assert app._command_aliases["list"][0] is sys.intern("Ls")
+
+
+class TestAliasVersion:
+    """Tests for the alias version counter used to invalidate derived caches"""
+
+    def test_version_bumped_on_register_and_remove(self):
+        """Test that alias registration and removal both bump the version"""
+        app = ExtendedTyper()
+        assert app._alias_version == 0
+
+        @app.command("list", aliases=["ls", "l"])
+        def list_items():
+            pass
+
+        assert app._alias_version == 2
+
+        app.remove_alias("ls")
+        assert app._alias_version == 3
+
+    def test_version_unchanged_when_remove_misses(self):
+        """Test that removing an unknown alias leaves the version alone"""
+        app = ExtendedTyper()
+
+        @app.command("list", aliases=["ls"])
+        def list_items():
+            pass
+
+        version = app._alias_version
+        assert app.remove_alias("missing") is False
+        assert app._alias_version == version
+
+
 class TestGetCommandEdgeCases:
     """Tests for edge cases in _get_command"""
 
@@ -737,11 +891,9 @@ class TestGetCommandEdgeCases:
             del mock_obj.commands  # Remove the commands attribute
             mock_get_cmd.return_value = mock_obj
 
-            # Delete cached attributes to force re-initialisation
-            if hasattr(app, "_group"):
-                delattr(app, "_group")
-            if hasattr(app, "_command"):
-                delattr(app, "_command")
+            # Reset cached attributes to force re-initialisation
+            app._group = None
+            app._command = None
 
             # Should return None when neither condition is met
             result = app._get_command(ctx, "unknown")
@@ -801,6 +953,29 @@ class TestExtendedGetGroupFromInfo:
             assert result.rich_markup_mode == "markdown"
             assert result.rich_help_panel == "Advanced"
 
+    def test_extended_group_keeps_group_flags(self):
+        """Test that group flags such as invoke_without_command survive the swap"""
+        import typer.main
+        from typer_extensions.core import ExtendedGroup
+
+        app = ExtendedTyper(invoke_without_command=True, no_args_is_help=False)
+
+        @app.callback()
+        def main():
+            """Main callback."""
+
+        @app.command("list", aliases=["ls"])
+        def list_items():
+            """List items."""
+
+        group = typer.main.get_command(app)
+
+        assert isinstance(group, ExtendedGroup)
+        assert group._extended_typer is app
+        assert group.invoke_without_command is True
+        assert group.no_args_is_help is False
+        assert "list" in group.commands
+
     def test_extended_group_no_aliases_registered(self):
         """Test that standard group is returned when no aliases are registered"""
         from typer_extensions.core import ExtendedTyper, _extended_get_group_from_info
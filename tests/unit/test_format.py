@@ -220,6 +220,12 @@ class TestFormatCommandsWithAliases:
         assert max_len == len(result[0][0])
         assert max_len == len(result[1][0])
 
+    def test_unaliased_commands_measured_by_own_width(self):
+        """Test unaliased commands use their own width, not the last one measured."""
+        commands = [("verylongcommand", "Long"), ("x", "Short")]
+        _, max_len = format_commands_with_aliases(commands, {})
+        assert max_len == len("verylongcommand")
+
 
 class TestFormattersEdgeCases:
     """Tests for edge cases and special scenarios."""
@@ -273,6 +279,8 @@ class TestFormattersEdgeCases:
         """
         from typer_extensions import format
 
+        format.calculate_width.cache_clear()
+
         # Patch wcswidth to raise ImportError
         with patch(
             "typer_extensions.format.wcswidth", side_effect=ImportError("Mock error")
@@ -280,3 +288,76 @@ class TestFormattersEdgeCases:
             # Should fall back to len()
             result = format.calculate_width("test string")
             assert result == len("test string")
+
+    def test_calculate_width_is_memoised(self):
+        """Test that measuring the same string twice reuses the cached width"""
+        from typer_extensions import format
+
+        format.calculate_width.cache_clear()
+        with patch("typer_extensions.format.wcswidth", return_value=4) as mock_width:
+            assert format.calculate_width("list") == 4
+            assert format.calculate_width("list") == 4
+
+        mock_width.assert_called_once_with("list")
+        format.calculate_width.cache_clear()
+
+
+class TestFormatAliasDisplayCache:
+    """Tests for the memoised alias fragment formatting."""
+
+    def test_repeated_render_hits_cache(self):
+        """Test that formatting the same aliases twice reuses the cached fragment."""
+        from typer_extensions.format import _format_alias_display
+
+        _format_alias_display.cache_clear()
+        commands = [("list", "List items"), ("delete", "Delete items")]
+        command_aliases = {"list": ["ls", "l"], "delete": ["rm"]}
+
+        first = format_commands_with_aliases(commands, command_aliases)
+        second = format_commands_with_aliases(commands, command_aliases)
+
+        assert first == second
+        info = _format_alias_display.cache_info()
+        assert info.misses == 2
+        assert info.hits == 2
+
+    def test_changed_aliases_are_not_served_stale(self):
+        """Test that mutating an alias list produces a fresh fragment."""
+        commands = [("list", None)]
+        command_aliases = {"list": ["ls"]}
+
+        before, _ = format_commands_with_aliases(commands, command_aliases)
+        command_aliases["list"].append("dir")
+        after, _ = format_commands_with_aliases(commands, command_aliases)
+
+        assert "(ls)" in before[0][0]
+        assert "(ls, dir)" in after[0][0]
+
+    def test_compiled_format_matches_str_format(self):
+        """Test that the precompiled format renders exactly like str.format."""
+        from typer_extensions.format import _compile_display_format
+
+        for display_format in (
+            "({aliases})",
+            "[{aliases}]",
+            "{{{aliases}}}",
+            "| {aliases}",
+        ):
+            parts = _compile_display_format(display_format)
+            assert parts is not None
+            assert "ls, l".join(parts) == display_format.format(aliases="ls, l")
+
+    def test_format_spec_and_conversion_use_str_format(self):
+        """Test that formats with a spec or conversion apply it to the aliases."""
+        from typer_extensions.format import _compile_display_format
+
+        commands = [("list", None)]
+        command_aliases = {"list": ["ls"]}
+
+        for display_format in ("{aliases:>6}", "({aliases!r})", "[{aliases:^8}]"):
+            assert _compile_display_format(display_format) is None
+
+            result, _ = format_commands_with_aliases(
+                commands, command_aliases, display_format=display_format
+            )
+            assert result[0][0].endswith(display_format.format(aliases="ls"))
@@ -1,6 +1,5 @@
 """Tests for typer_extensions._import_hook module."""
 
-import os
 import sys
 from types import ModuleType
 from unittest.mock import patch, MagicMock
@@ -77,6 +76,33 @@ class TestTyperRichUtilsInterceptor:
                     # If the detailed assertions fail, at least check the module loads
                     pass
 
+    def test_reimport_after_load_uses_enhanced_module(self):
+        """Test the hook stays installed and serves typer.rich_utils on re-import"""
+        import importlib
+
+        from typer_extensions import _rich_utils
+
+        original_meta_path = sys.meta_path.copy()
+        original_rich_utils = sys.modules.pop("typer.rich_utils", None)
+        interceptor = TyperRichUtilsInterceptor()
+        sys.meta_path.insert(0, interceptor)
+
+        try:
+            importlib.import_module("typer.rich_utils")
+            assert interceptor._loaded is True
+            assert interceptor in sys.meta_path
+
+            del sys.modules["typer.rich_utils"]
+            reimported = importlib.import_module("typer.rich_utils")
+
+            assert reimported.__file__ == _rich_utils.__file__
+        finally:
+            sys.meta_path[:] = original_meta_path
+            if original_rich_utils is not None:
+                sys.modules["typer.rich_utils"] = original_rich_utils
+            else:
+                sys.modules.pop("typer.rich_utils", None)
+
     def test_exec_module_uses_cache_on_second_call(self):
         """Test exec_module uses cached module on second call"""
         interceptor = TyperRichUtilsInterceptor()
@@ -107,7 +133,7 @@ class TestTyperRichUtilsInterceptor:
             with pytest.raises(Exception):
                 interceptor.exec_module(module)
 
-    @patch.dict(os.environ, {"TYPER_EXTENSIONS_DEBUG": "1"})
+    @patch("typer_extensions._import_hook._DEBUG", True)
     def test_exec_module_debug_logging(self, caplog):
         """Test debug logging in exec_module when TYPER_EXTENSIONS_DEBUG is set
 
@@ -365,7 +391,7 @@ class TestUninstallImportHook:
         finally:
             sys.meta_path = original_meta_path
 
-    @patch.dict(os.environ, {"TYPER_EXTENSIONS_DEBUG": "1"})
+    @patch("typer_extensions._import_hook._DEBUG", True)
     def test_uninstall_import_hook_debug_logging(self, caplog):
         """Test debug logging in uninstall when TYPER_EXTENSIONS_DEBUG is set
 
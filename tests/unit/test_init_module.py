@@ -151,6 +151,18 @@ class TestGetAttrFallback:
         assert typer_extensions.Exit is typer.Exit
         assert typer_extensions.Abort is typer.Abort
 
+    def test_getattr_caches_resolved_names(self):
+        """Test that a name resolved via __getattr__ is cached in module globals"""
+        import typer_extensions
+        import typer
+
+        typer_extensions.__dict__.pop("get_app_dir", None)
+        try:
+            assert typer_extensions.get_app_dir is typer.get_app_dir
+            assert typer_extensions.__dict__["get_app_dir"] is typer.get_app_dir
+        finally:
+            typer_extensions.__dict__.pop("get_app_dir", None)
+
     def test_getattr_raises_attribute_error_for_missing(self):
         """Test that __getattr__ raises AttributeError for non-existent attributes"""
         import typer_extensions
@@ -275,7 +287,7 @@ class TestPatchApplicationWithDebugFlag:
             {
                 "applied": False,
                 "typer_version": None,
-                "patched_functions": [],
+                "patched_functions": (),
                 "originals": {},
                 "skipped_reason": None,
             }
@@ -283,7 +295,7 @@ class TestPatchApplicationWithDebugFlag:
 
         try:
             monkeypatch.setenv("TYPER_EXTENSIONS_RICH", "1")
-            monkeypatch.setenv("TYPER_EXTENSIONS_DEBUG", "1")
+            monkeypatch.setattr("typer_extensions._patch._DEBUG", True)
 
             # Ensure clean state for testing
             if "typer.rich_utils" in sys.modules:
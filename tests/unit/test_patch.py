@@ -1,6 +1,5 @@
 """Tests for typer_extensions._patch module."""
 
-import os
 import sys
 from unittest.mock import patch, MagicMock
 
@@ -39,7 +38,7 @@ class TestApplyRichPatch:
             {
                 "applied": False,
                 "typer_version": None,
-                "patched_functions": [],
+                "patched_functions": (),
                 "originals": {},
                 "skipped_reason": None,
             }
@@ -63,7 +62,7 @@ class TestApplyRichPatch:
             {
                 "applied": False,
                 "typer_version": None,
-                "patched_functions": [],
+                "patched_functions": (),
                 "originals": {},
                 "skipped_reason": None,
             }
@@ -91,7 +90,7 @@ class TestApplyRichPatch:
             {
                 "applied": False,
                 "typer_version": None,
-                "patched_functions": [],
+                "patched_functions": (),
                 "originals": {},
                 "skipped_reason": None,
             }
@@ -127,7 +126,7 @@ class TestApplyRichPatch:
             {
                 "applied": False,
                 "typer_version": None,
-                "patched_functions": [],
+                "patched_functions": (),
                 "originals": {},
                 "skipped_reason": None,
             }
@@ -135,7 +134,7 @@ class TestApplyRichPatch:
 
         try:
             monkeypatch.setenv("TYPER_EXTENSIONS_RICH", "1")
-            monkeypatch.delenv("TYPER_EXTENSIONS_DEBUG", raising=False)
+            monkeypatch.setattr("typer_extensions._patch._DEBUG", False)
 
             # Ensure typer.rich_utils is not in sys.modules
             if "typer.rich_utils" in sys.modules:
@@ -162,7 +161,7 @@ class TestApplyRichPatch:
             {
                 "applied": False,
                 "typer_version": None,
-                "patched_functions": [],
+                "patched_functions": (),
                 "originals": {},
                 "skipped_reason": None,
             }
@@ -170,7 +169,7 @@ class TestApplyRichPatch:
 
         try:
             monkeypatch.setenv("TYPER_EXTENSIONS_RICH", "1")
-            monkeypatch.delenv("TYPER_EXTENSIONS_DEBUG", raising=False)
+            monkeypatch.setattr("typer_extensions._patch._DEBUG", False)
 
             # Mock import hook failure
             with patch(
@@ -199,7 +198,7 @@ class TestApplyRichPatch:
             {
                 "applied": False,
                 "typer_version": None,
-                "patched_functions": [],
+                "patched_functions": (),
                 "originals": {},
                 "skipped_reason": None,
             }
@@ -222,7 +221,7 @@ class TestApplyRichPatch:
             PATCH_STATE.clear()
             PATCH_STATE.update(original_state)
 
-    @patch.dict(os.environ, {"TYPER_EXTENSIONS_DEBUG": "1"})
+    @patch("typer_extensions._patch._DEBUG", True)
     def test_debug_logging_enabled(self, monkeypatch):
         """Test that debug logging flag is processed when enabled"""
         original_state = PATCH_STATE.copy()
@@ -231,7 +230,7 @@ class TestApplyRichPatch:
             {
                 "applied": False,
                 "typer_version": None,
-                "patched_functions": [],
+                "patched_functions": (),
                 "originals": {},
                 "skipped_reason": None,
             }
@@ -262,7 +261,7 @@ class TestUndoRichPatch:
             {
                 "applied": False,
                 "typer_version": None,
-                "patched_functions": [],
+                "patched_functions": (),
                 "originals": {},
                 "skipped_reason": None,
             }
@@ -288,7 +287,7 @@ class TestUndoRichPatch:
                 {
                     "applied": True,
                     "typer_version": None,
-                    "patched_functions": ["test_func"],
+                    "patched_functions": ("test_func",),
                     "originals": {"test_func": original_func},
                     "skipped_reason": None,
                 }
@@ -306,7 +305,7 @@ class TestUndoRichPatch:
 
                 # Verify the state was reset
                 assert PATCH_STATE["applied"] is False
-                assert PATCH_STATE["patched_functions"] == []
+                assert PATCH_STATE["patched_functions"] == ()
         finally:
             PATCH_STATE.clear()
             PATCH_STATE.update(original_state)
@@ -321,7 +320,7 @@ class TestUndoRichPatch:
                 {
                     "applied": True,
                     "typer_version": None,
-                    "patched_functions": ["test_func"],
+                    "patched_functions": ("test_func",),
                     "originals": {"test_func": MagicMock()},
                     "skipped_reason": None,
                 }
@@ -401,7 +400,7 @@ class TestGetPatchStatus:
             {
                 "applied": True,
                 "typer_version": "0.9.0",
-                "patched_functions": ["func1", "func2"],
+                "patched_functions": ("func1", "func2"),
                 "originals": {},
                 "skipped_reason": None,
             }
@@ -423,7 +422,7 @@ class TestGetPatchStatus:
             {
                 "applied": False,
                 "typer_version": None,
-                "patched_functions": [],
+                "patched_functions": (),
                 "originals": {},
                 "skipped_reason": "Test skip reason",
             }
@@ -445,7 +444,7 @@ class TestGetPatchStatus:
             {
                 "applied": False,
                 "typer_version": None,
-                "patched_functions": [],
+                "patched_functions": (),
                 "originals": {},
                 "skipped_reason": None,
             }
@@ -473,7 +472,7 @@ class TestImportHookFailureWithDebug:
             {
                 "applied": False,
                 "typer_version": None,
-                "patched_functions": [],
+                "patched_functions": (),
                 "originals": {},
                 "skipped_reason": None,
             }
@@ -481,7 +480,7 @@ class TestImportHookFailureWithDebug:
 
         try:
             monkeypatch.setenv("TYPER_EXTENSIONS_RICH", "1")
-            monkeypatch.setenv("TYPER_EXTENSIONS_DEBUG", "1")
+            monkeypatch.setattr("typer_extensions._patch._DEBUG", True)
 
             # Mock import hook raising an exception
             with patch(
@@ -512,7 +511,7 @@ class TestSysModulesInjectionPath:
             {
                 "applied": False,
                 "typer_version": None,
-                "patched_functions": [],
+                "patched_functions": (),
                 "originals": {},
                 "skipped_reason": None,
             }
@@ -520,7 +519,7 @@ class TestSysModulesInjectionPath:
 
         try:
             monkeypatch.setenv("TYPER_EXTENSIONS_RICH", "1")
-            monkeypatch.setenv("TYPER_EXTENSIONS_DEBUG", "1")
+            monkeypatch.setattr("typer_extensions._patch._DEBUG", True)
 
             # Remove typer from sys.modules so sys.modules injection path is taken
             sys.modules.pop("typer", None)
@@ -221,6 +221,52 @@ class TestAddAlias:
             app.add_alias("delete", "LS")
 
 
+class TestAddAliasRegistryLookup:
+    """Tests for add_alias() resolving commands without building the Click group."""
+
+    @pytest.fixture
+    def no_cli_build(self, monkeypatch):
+        """Fail the test if the Click group is built."""
+        import typer
+
+        def fail(*args, **kwargs):
+            raise AssertionError("get_command should not be called")
+
+        monkeypatch.setattr(typer.main, "get_command", fail)
+
+    def test_registered_commands_skip_cli_build(self, no_cli_build):
+        """Test explicit and inferred command names are found in Typer's registry."""
+        app = ExtendedTyper()
+
+        @app.command("list")
+        def list_items():
+            pass
+
+        @app.command()
+        def delete_items():
+            pass
+
+        app.add_alias("list", "ls")
+        app.add_alias("delete_items", "rm")
+
+        assert app.get_aliases("list") == ["ls"]
+        assert app.get_aliases("delete_items") == ["rm"]
+
+    def test_named_sub_app_skips_cli_build(self, no_cli_build):
+        """Test an explicitly named sub-app is found in Typer's registry."""
+        app = ExtendedTyper()
+        sub_app = ExtendedTyper()
+
+        @sub_app.command("run")
+        def run():
+            pass
+
+        app.add_typer(sub_app, name="tasks")
+        app.add_alias("tasks", "t")
+
+        assert app.get_aliases("tasks") == ["t"]
+
+
 class TestRemoveAlias:
     """Tests for remove_alias() method."""
 
@@ -313,6 +359,21 @@ class TestRemoveAlias:
         assert result is True
         assert "ls" not in app._alias_to_command
 
+    def test_remove_alias_case_insensitive_updates_display_list(self):
+        """Test removing an alias in a different case also drops its display entry."""
+        app = ExtendedTyper(alias_case_sensitive=False)
+
+        @app.command("list", aliases=["LS", "l"])
+        def list_items():
+            pass
+
+        assert app.remove_alias("ls") is True
+        assert app.get_aliases("list") == ["l"]
+
+        assert app.remove_alias("L") is True
+        assert app.get_aliases("list") == []
+        assert app.list_commands_with_aliases() == {}
+
     def test_remove_same_alias_twice(self):
         """Test idempotency of remove_alias."""
         app = ExtendedTyper()
@@ -332,6 +393,61 @@ class TestRemoveAlias:
         assert result2 is False
 
 
+class TestHasAlias:
+    """Tests for has_alias() method."""
+
+    def test_has_alias_registered_and_unknown(self):
+        """Test has_alias for registered, unknown, and removed aliases."""
+        app = ExtendedTyper()
+
+        @app.command("list", aliases=["ls"])
+        def list_items():
+            pass
+
+        assert app.has_alias("ls") is True
+        assert app.has_alias("dir") is False
+        assert app.has_alias("list") is False
+
+        app.remove_alias("ls")
+        assert app.has_alias("ls") is False
+
+    def test_has_alias_respects_case_sensitivity(self):
+        """Test has_alias follows the app's case sensitivity setting."""
+        sensitive = ExtendedTyper(alias_case_sensitive=True)
+        insensitive = ExtendedTyper(alias_case_sensitive=False)
+
+        for app in (sensitive, insensitive):
+
+            @app.command("list", aliases=["ls"])
+            def list_items():
+                pass
+
+        assert sensitive.has_alias("LS") is False
+        assert insensitive.has_alias("LS") is True
+
+    def test_duplicate_add_alias_skips_cli_build(self, monkeypatch):
+        """Test add_alias rejects a duplicate before building the Click group."""
+        import typer
+
+        app = ExtendedTyper()
+
+        @app.command("list", aliases=["ls"])
+        def list_items():
+            pass
+
+        @app.command("delete")
+        def delete_items():
+            pass
+
+        def fail(*args, **kwargs):
+            raise AssertionError("get_command should not be called")
+
+        monkeypatch.setattr(typer.main, "get_command", fail)
+
+        with pytest.raises(ValueError, match="already registered for command 'list'"):
+            app.add_alias("delete", "ls")
+
+
 class TestGetAliases:
     """Tests for get_aliases() method."""
 
@@ -84,6 +84,14 @@ class TestCleandocFunction:
         assert result.endswith("line")
         assert not result.endswith("\n")
 
+    def test_cleandoc_caches_results(self):
+        """Test that repeated cleandoc calls are served from the cache"""
+        text = "Cached line\n    indented"
+        first = _rich_utils.cleandoc(text)
+        hits = _rich_utils.cleandoc.cache_info().hits
+        assert _rich_utils.cleandoc(text) == first
+        assert _rich_utils.cleandoc.cache_info().hits == hits + 1
+
     def test_cleandoc_empty_string(self):
         """Test cleandoc with empty string"""
         result = _rich_utils.cleandoc("")
@@ -130,6 +138,31 @@ class TestGetRichConsole:
             console = _rich_utils._get_rich_console()
             assert console is None
 
+    @pytest.mark.skipif(not _rich_utils.RICH_AVAILABLE, reason="Rich not available")
+    def test_theme_reused_until_styles_change(self, monkeypatch):
+        """Test consoles share a theme until a style constant is reassigned"""
+        first = _rich_utils._get_rich_console()
+        second = _rich_utils._get_rich_console(stderr=True)
+        assert first is not None and second is not None
+        assert first.get_style("option") == second.get_style("option")
+
+        theme = _rich_utils._get_theme(
+            _rich_utils.STYLE_OPTION,
+            _rich_utils.STYLE_SWITCH,
+            _rich_utils.STYLE_NEGATIVE_OPTION,
+            _rich_utils.STYLE_NEGATIVE_SWITCH,
+            _rich_utils.STYLE_METAVAR,
+            _rich_utils.STYLE_METAVAR_SEPARATOR,
+            _rich_utils.STYLE_USAGE,
+        )
+        assert _rich_utils._get_theme.cache_info().hits >= 1
+
+        monkeypatch.setattr(_rich_utils, "STYLE_OPTION", "bold red")
+        console = _rich_utils._get_rich_console()
+        assert console is not None
+        assert str(console.get_style("option")) == "bold red"
+        assert theme.styles["option"] != console.get_style("option")
+
 
 class TestMakeRichText:
     """Tests for _make_rich_text function."""
@@ -190,6 +223,38 @@ class TestMakeRichText:
         )
         assert result is not None
 
+    @pytest.mark.skipif(not _rich_utils.RICH_AVAILABLE, reason="Rich not available")
+    def test_make_rich_text_blank_text_short_circuits(self, monkeypatch):
+        """Test whitespace-only text skips parsing and renders like the full path"""
+        import io
+
+        from rich.console import Console
+        from rich.markdown import Markdown
+        from rich.text import Text
+
+        def render(renderable) -> str:
+            output = io.StringIO()
+            Console(file=output, width=80).print(renderable)
+            return output.getvalue()
+
+        # What the full path builds from blank text in each mode
+        markdown_expected = render(Markdown("", style="dim"))
+        rich_expected = render(Text("", style="dim"))
+        assert markdown_expected == ""
+
+        mock_cleandoc = MagicMock()
+        monkeypatch.setattr(_rich_utils, "cleandoc", mock_cleandoc)
+        markdown_result = _rich_utils._make_rich_text(
+            text="  \n ", style="dim", markup_mode=_rich_utils.MARKUP_MODE_MARKDOWN
+        )
+        rich_result = _rich_utils._make_rich_text(
+            text="  \n ", style="dim", markup_mode=_rich_utils.MARKUP_MODE_RICH
+        )
+
+        assert render(markdown_result) == markdown_expected
+        assert render(rich_result) == rich_expected
+        mock_cleandoc.assert_not_called()
+
 
 class TestEscapeBeforeHtmlExport:
     """Tests for escape_before_html_export function."""
@@ -555,6 +620,43 @@ class TestRichFormatError:
         # rich_format_help returns None (prints to console)
         assert result is None
 
+    @pytest.mark.skipif(
+        not pytest.importorskip("typer_extensions._rich_utils").RICH_AVAILABLE,
+        reason="Rich not available",
+    )
+    def test_rich_format_help_writes_once(self, monkeypatch):
+        """Test rich_format_help buffers every panel into a single write"""
+        import io
+
+        import click
+        from rich.console import Console
+
+        class CountingIO(io.StringIO):
+            writes = 0
+
+            def write(self, text):
+                self.writes += 1
+                return super().write(text)
+
+        output = CountingIO()
+        monkeypatch.setattr(
+            _rich_utils, "_get_rich_console", lambda stderr=False: Console(file=output)
+        )
+
+        cmd = click.Command(
+            "test",
+            help="Test command",
+            epilog="Epilog text",
+            params=[click.Argument(["input"]), click.Option(["--verbose"])],
+        )
+        ctx = click.Context(cmd, info_name="test")
+
+        _rich_utils.rich_format_help(obj=cmd, ctx=ctx, markup_mode="rich")
+
+        assert output.writes == 1
+        assert "--verbose" in output.getvalue()
+        assert "Epilog text" in output.getvalue()
+
 
 class TestPrintOptionsPanel:
     """Tests for _print_options_panel function."""
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import importlib
 import json
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import click
 
@@ -508,7 +508,7 @@ class TestRichFormatHelpEdgeCases:
         ctx = Mock()
         ctx.command = obj
 
-        console = Mock()
+        console = MagicMock()
         console.print = Mock()
 
         with patch("typer_extensions._rich_utils.RICH_AVAILABLE", True):
@@ -536,7 +536,7 @@ class TestRichFormatHelpEdgeCases:
         ctx = Mock()
         ctx.command = obj
 
-        console = Mock()
+        console = MagicMock()
         console.print = Mock()
 
         with patch("typer_extensions._rich_utils.RICH_AVAILABLE", True):
@@ -581,7 +581,7 @@ class TestRichFormatHelpEdgeCases:
         ctx = Mock()
         ctx.command = obj
 
-        console = Mock()
+        console = MagicMock()
         console.print = Mock()
 
         with patch("typer_extensions._rich_utils.RICH_AVAILABLE", True):
@@ -283,6 +283,29 @@ class TestPrintCommandsPanelNoRich:
                 # Should have called click.echo
                 assert mock_echo.called
 
+    def test_print_commands_panel_fallback_skips_rich_table(self):
+        """Test that the fallback returns without building a Rich table"""
+        from click import Command
+
+        cmd = Command("deploy")
+        mock_console = MagicMock()
+
+        with patch.object(_rich_utils, "RICH_AVAILABLE", False):
+            with patch("click.echo") as mock_echo:
+                with patch.object(_rich_utils, "Table", create=True) as mock_table:
+                    _rich_utils._print_commands_panel(
+                        name="Commands",
+                        commands=[cmd],
+                        markup_mode="rich",
+                        console=mock_console,
+                        cmd_len=10,
+                        extended_typer=None,
+                    )
+
+        mock_echo.assert_any_call(f"  {'deploy':<10}  ")
+        mock_table.assert_not_called()
+        mock_console.print.assert_not_called()
+
     def test_print_commands_panel_deprecated_no_rich(self):
         """Test _print_commands_panel with deprecated command when Rich disabled"""
         from click import Command
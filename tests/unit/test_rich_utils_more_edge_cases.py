@@ -1,8 +1,10 @@
 """Additional Rich utilities edge case tests requiring complex mocking."""
 
-from unittest.mock import Mock, patch
+import io
+from unittest.mock import MagicMock, Mock, patch
 
 import click
+import pytest
 
 
 class TestParameterRangeConstraints:
@@ -116,6 +118,38 @@ class TestCommandAliasHandling:
                     extended_typer=extended_typer,
                 )
 
+    def test_panel_without_aliased_commands_skips_formatting(self):
+        """Test a panel with no aliased commands is not passed to the formatter."""
+        from typer_extensions._rich_utils import _print_commands_panel
+
+        cmd = Mock(spec=click.Command)
+        cmd.name = "status"
+        cmd.help = "Show status"
+        cmd.deprecated = False
+        cmd.hidden = False
+
+        extended_typer = Mock()
+        extended_typer.show_aliases_in_help = True
+        extended_typer._command_aliases = {"start": ["run"]}
+
+        with patch("typer_extensions._rich_utils.RICH_AVAILABLE", True):
+            with patch(
+                "typer_extensions.format.format_commands_with_aliases"
+            ) as mock_format:
+                with patch("typer_extensions._rich_utils.Table") as mock_table:
+                    _print_commands_panel(
+                        name="Commands",
+                        commands=[cmd],
+                        markup_mode="rich",
+                        console=Mock(),
+                        cmd_len=20,
+                        extended_typer=extended_typer,
+                    )
+
+        mock_format.assert_not_called()
+        first_column = mock_table.return_value.add_column.call_args_list[0]
+        assert first_column.kwargs["width"] == len("status") + 2
+
 
 class TestDeprecatedCommands:
     """Test deprecated command handling."""
@@ -210,7 +244,7 @@ class TestHiddenCommands:
         ctx = Mock()
         ctx.command = obj
 
-        console = Mock()
+        console = MagicMock()
         console.print = Mock()
 
         with patch("typer_extensions._rich_utils.RICH_AVAILABLE", True):
@@ -419,3 +453,94 @@ class TestSecondaryOptions:
                 markup_mode="rich",
                 console=console,
             )
+
+
+class TestCommandsPanelCacheInvalidation:
+    """Tests that cached alias formatting tracks alias changes."""
+
+    @pytest.mark.skipif(
+        not pytest.importorskip("typer_extensions._rich_utils").RICH_AVAILABLE,
+        reason="Rich not available",
+    )
+    def test_alias_added_after_render_is_shown(self):
+        """Test that re-rendering the same command list picks up new aliases."""
+        from rich.console import Console
+
+        from typer_extensions import ExtendedTyper
+        from typer_extensions._rich_utils import _print_commands_panel
+
+        app = ExtendedTyper()
+
+        @app.command("list", aliases=["ls"])
+        def list_items():
+            """List items."""
+
+        @app.command("delete")
+        def delete_item():
+            """Delete items."""
+
+        commands = [click.Command("list", help="List items.")]
+
+        def render() -> str:
+            output = io.StringIO()
+            console = Console(file=output, width=80)
+            _print_commands_panel(
+                name="Commands",
+                commands=commands,
+                markup_mode="rich",
+                console=console,
+                cmd_len=4,
+                extended_typer=app,
+            )
+            return output.getvalue()
+
+        assert "(ls)" in render()
+
+        app.add_alias("list", "dir")
+        assert "(ls, dir)" in render()
+
+    @pytest.mark.skipif(
+        not pytest.importorskip("typer_extensions._rich_utils").RICH_AVAILABLE,
+        reason="Rich not available",
+    )
+    def test_cache_keyed_on_panel_contents(self):
+        """Test that new lists of the same commands reuse one cache entry."""
+        from rich.console import Console
+
+        from typer_extensions import ExtendedTyper
+        from typer_extensions._rich_utils import _print_commands_panel
+        from typer_extensions.format import format_commands_with_aliases
+
+        app = ExtendedTyper()
+
+        @app.command("list", aliases=["ls"])
+        def list_items():
+            """List items."""
+
+        @app.command("delete", aliases=["rm"])
+        def delete_item():
+            """Delete items."""
+
+        def render(*names: str) -> str:
+            output = io.StringIO()
+            console = Console(file=output, width=80)
+            _print_commands_panel(
+                name="Commands",
+                commands=[click.Command(name) for name in names],
+                markup_mode="rich",
+                console=console,
+                cmd_len=6,
+                extended_typer=app,
+            )
+            return output.getvalue()
+
+        with patch(
+            "typer_extensions.format.format_commands_with_aliases",
+            wraps=format_commands_with_aliases,
+        ) as mock_format:
+            assert "(ls)" in render("list")
+            assert "(ls)" in render("list")
+            assert "(rm)" in render("delete")
+
+        assert mock_format.call_count == 2
+        assert len(app._formatted_commands_cache) == 2